@@ -6,18 +6,27 @@ Routes emails based on alert severity (critical, warning, info).
 """
 
 import os
+import html
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
-from datetime import datetime
+import queue
+import string
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.message import EmailMessage
+from typing import List, Literal, Optional, Sequence, Tuple
+from datetime import datetime, timezone
 import logging
 from pathlib import Path
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field
-import markdown
-from markdown.extensions import fenced_code, tables, nl2br
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from starlette.concurrency import run_in_threadpool
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound, select_autoescape
+from markdown_it import MarkdownIt
+from markupsafe import Markup
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +39,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="DevOps RCA Notifier Service",
     description="Email notification service for incident reports",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 
@@ -38,10 +48,16 @@ app = FastAPI(
 class NotifyRequest(BaseModel):
     """Request model for sending incident notifications."""
     alert_name: str = Field(..., description="Name of the alert")
-    severity: str = Field(..., description="Alert severity: critical, warning, or info")
+    severity: Literal['critical', 'warning', 'info'] = Field(..., description="Alert severity: critical, warning, or info")
     report_markdown: str = Field(..., description="Incident report in markdown format")
     namespace: Optional[str] = Field(None, description="Kubernetes namespace")
 
+    @field_validator('severity', mode='before')
+    @classmethod
+    def normalize_severity(cls, value):
+        """Accept severities case-insensitively."""
+        return value.lower() if isinstance(value, str) else value
+
 
 class TestEmailRequest(BaseModel):
     """Request model for testing email functionality."""
@@ -49,79 +65,184 @@ class TestEmailRequest(BaseModel):
     test_message: Optional[str] = Field("Test email from DevOps RCA Notifier", description="Test message")
 
 
+def json_body(model: type[BaseModel]):
+    """
+    Build a dependency that validates the raw request body against a model.
+
+    pydantic-core parses the JSON bytes directly, skipping the intermediate
+    dict FastAPI would otherwise build with the stdlib json module.
+
+    Args:
+        model: Request model class
+
+    Returns:
+        FastAPI dependency returning a validated model instance
+    """
+    async def parse(request: Request):
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            errors = [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=body)
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict:
+    """OpenAPI request body for routes using json_body()."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
 # Configuration from environment
 SMTP_HOST = os.environ.get('SMTP_HOST', 'smtp.gmail.com')
 SMTP_PORT = int(os.environ.get('SMTP_PORT', '587'))
 SMTP_USER = os.environ.get('SMTP_USER', '')
 SMTP_PASSWORD = os.environ.get('SMTP_PASSWORD', '')
 SMTP_FROM = os.environ.get('SMTP_FROM', SMTP_USER)
+SMTP_POOL_SIZE = max(1, int(os.environ.get('SMTP_POOL_SIZE', '4')))
+
+# Up to this many recipients share a single message and DATA phase; larger
+# lists get one message per recipient, sent in parallel over the pool
+PER_RECIPIENT_THRESHOLD = 3
+
+
+def _parse_recipients(env_var: str) -> Tuple[str, ...]:
+    """Parse a comma-separated recipient env var, dropping empty entries."""
+    return tuple(r for r in (r.strip() for r in os.environ.get(env_var, '').split(',')) if r)
+
+
+# Recipient configuration based on severity, parsed once into immutable tuples
+RECIPIENTS_CRITICAL = _parse_recipients('RECIPIENTS_CRITICAL')
+RECIPIENTS_WARNING = _parse_recipients('RECIPIENTS_WARNING')
+RECIPIENTS_INFO = _parse_recipients('RECIPIENTS_INFO')
+
+RECIPIENTS_BY_SEVERITY = {
+    'critical': RECIPIENTS_CRITICAL,
+    'warning': RECIPIENTS_WARNING,
+    'info': RECIPIENTS_INFO,
+}
+
+# Pre-joined To: headers per severity, built once instead of per email
+JOINED_RECIPIENTS = {
+    'critical': ', '.join(RECIPIENTS_CRITICAL),
+    'warning': ', '.join(RECIPIENTS_WARNING),
+    'info': ', '.join(RECIPIENTS_INFO),
+}
+
+_UTC = timezone.utc
+
 
-# Recipient configuration based on severity
-RECIPIENTS_CRITICAL = os.environ.get('RECIPIENTS_CRITICAL', '').split(',')
-RECIPIENTS_WARNING = os.environ.get('RECIPIENTS_WARNING', '').split(',')
-RECIPIENTS_INFO = os.environ.get('RECIPIENTS_INFO', '').split(',')
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(_UTC).isoformat(timespec='seconds')
 
-# Filter empty strings from recipient lists
-RECIPIENTS_CRITICAL = [r.strip() for r in RECIPIENTS_CRITICAL if r.strip()]
-RECIPIENTS_WARNING = [r.strip() for r in RECIPIENTS_WARNING if r.strip()]
-RECIPIENTS_INFO = [r.strip() for r in RECIPIENTS_INFO if r.strip()]
+
+# Upper-cased severity labels for email subjects
+SEVERITY_LABELS = {'critical': 'CRITICAL', 'warning': 'WARNING', 'info': 'INFO'}
 
 # Template loading
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 EMAIL_TEMPLATE_PATH = TEMPLATE_DIR / "email_template.html"
 
-def load_email_template() -> str:
+# Jinja environment compiled once at startup; auto_reload is off so renders
+# never stat the template file
+_jinja_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False
+)
+
+def load_email_template() -> Template:
     """
-    Load email HTML template from file.
+    Load and compile email HTML template from file.
 
     Returns:
-        HTML template string with {content} placeholder
+        Compiled template rendering a `content` variable
     """
     try:
-        with open(EMAIL_TEMPLATE_PATH, 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
-        logger.error(f"Email template not found at {EMAIL_TEMPLATE_PATH}")
+        return _jinja_env.get_template(EMAIL_TEMPLATE_PATH.name)
+    except TemplateNotFound:
+        logger.error("Email template not found at %s", EMAIL_TEMPLATE_PATH)
         raise
     except Exception as e:
-        logger.error(f"Failed to load email template: {e}")
+        logger.error("Failed to load email template: %s", e)
         raise
 
+# Pool of long-lived SMTP connections shared across requests. Each slot holds
+# a connection or None (not connected yet / dropped); see _checkout_smtp.
+_smtp_pool: "queue.LifoQueue[Optional[smtplib.SMTP]]" = queue.LifoQueue()
+for _ in range(SMTP_POOL_SIZE):
+    _smtp_pool.put(None)
+
+# Worker threads for per-recipient fan-out, one per pooled connection
+_send_executor = ThreadPoolExecutor(max_workers=SMTP_POOL_SIZE, thread_name_prefix='smtp-send')
+
+# Markdown renderer built once at startup: CommonMark (fenced code included)
+# plus tables, with single newlines rendered as <br>. render() keeps no
+# per-call state on the instance, so it is safe to share across threads.
+_MD = MarkdownIt('commonmark', {'breaks': True}).enable('table')
+
 # Load template at startup
 try:
     EMAIL_TEMPLATE = load_email_template()
-    logger.info(f"Email template loaded successfully from {EMAIL_TEMPLATE_PATH}")
+    logger.info("Email template loaded successfully from %s", EMAIL_TEMPLATE_PATH)
 except Exception as e:
-    logger.warning(f"Failed to load email template: {e}. Using fallback inline template.")
+    logger.warning("Failed to load email template: %s. Using fallback inline template.", e)
     # Fallback inline template (minimal)
-    EMAIL_TEMPLATE = """<!DOCTYPE html>
-<html><body><div>{content}</div></body></html>"""
+    EMAIL_TEMPLATE = _jinja_env.from_string("""<!DOCTYPE html>
+<html><body><div>{{ content }}</div></body></html>""")
 
 
-def get_recipients_for_severity(severity: str) -> List[str]:
+def get_recipients_for_severity(severity: str) -> Tuple[str, ...]:
     """
     Get email recipients based on alert severity.
 
     Args:
-        severity: Alert severity (critical, warning, info)
+        severity: Alert severity (critical, warning, info), already validated
+            and lower-cased by NotifyRequest
 
     Returns:
-        List of recipient email addresses
+        Tuple of recipient email addresses
     """
-    severity_lower = severity.lower()
-
-    if severity_lower == 'critical':
-        return RECIPIENTS_CRITICAL
-    elif severity_lower == 'warning':
-        return RECIPIENTS_WARNING
-    elif severity_lower == 'info':
-        return RECIPIENTS_INFO
-    else:
-        logger.warning(f"Unknown severity '{severity}', using WARNING recipients")
-        return RECIPIENTS_WARNING
+    return RECIPIENTS_BY_SEVERITY[severity]
 
 
-def markdown_to_html(markdown_text: str) -> str:
+def wrap_html(html_content: str) -> bytes:
+    """
+    Inject an HTML fragment into the email template.
+
+    Args:
+        html_content: HTML body content
+
+    Returns:
+        Styled HTML, UTF-8 encoded
+    """
+    # Already-rendered HTML is marked safe up front so autoescaping passes it
+    # through without scanning it
+    return EMAIL_TEMPLATE.render(content=Markup(html_content)).encode('utf-8')
+
+
+@lru_cache(maxsize=128)
+def _render(markdown_text: str) -> bytes:
+    """
+    Render markdown into the styled email template.
+
+    Cached so duplicate reports (Alertmanager retries, alert storms) skip
+    conversion.
+    """
+    return wrap_html(_MD.render(markdown_text))
+
+
+def markdown_to_html(markdown_text: str) -> bytes:
     """
     Convert markdown to styled HTML for email using external template.
 
@@ -129,31 +250,163 @@ def markdown_to_html(markdown_text: str) -> str:
         markdown_text: Markdown content
 
     Returns:
-        Styled HTML string
+        Styled HTML, UTF-8 encoded
     """
-    # Convert markdown to HTML with extensions
-    html_content = markdown.markdown(
-        markdown_text,
-        extensions=['fenced_code', 'tables', 'nl2br']
-    )
+    return _render(markdown_text)
 
-    # Inject content into template
-    styled_html = EMAIL_TEMPLATE.format(content=html_content)
 
-    return styled_html
+# Static part of the test email, converted to HTML once at startup. Only the
+# header with the message, timestamp and recipients is rendered per request.
+TEST_EMAIL_STATIC_MARKDOWN = f"""
+**SMTP Server:** {SMTP_HOST}:{SMTP_PORT}
+
+**From:** {SMTP_FROM}
+
+---
+
+If you received this email, your notifier service is configured correctly!
+
+## Sample Incident Report Format
+
+### Executive Summary
+This is what a real incident report would look like.
+
+### Timeline
+- 14:00 - Event 1
+- 14:01 - Event 2
+- 14:02 - Alert fired
+
+### Root Cause
+**Primary Cause:** Test scenario
+
+### Solutions
+
+#### Immediate Fix
+```bash
+kubectl get pods
+```
 
+#### Root Fix
+1. Step one
+2. Step two
+
+---
 
-def send_email(recipients: List[str], subject: str, html_content: str) -> None:
+**Generated by:** DevOps RCA Notifier Service v0.1.0
+"""
+
+TEST_EMAIL_STATIC_HTML = _MD.render(TEST_EMAIL_STATIC_MARKDOWN)
+
+# Per-request header of the test email, already in HTML so it skips markdown
+TEST_EMAIL_HEADER_TEMPLATE = string.Template(
+    "<h1>Test Email</h1>\n"
+    "<p>$msg</p>\n"
+    "<h2>Configuration Test</h2>\n"
+    "<p>This is a test email from the DevOps RCA Notifier Service.</p>\n"
+    "<p><strong>Timestamp:</strong> $ts</p>\n"
+    "<p><strong>Recipients:</strong> $rcpts</p>\n"
+)
+
+
+def _connect_smtp() -> smtplib.SMTP:
+    """
+    Open a new authenticated SMTP connection.
+
+    Returns:
+        Connected SMTP client with STARTTLS and login completed
+    """
+    logger.info("Connecting to SMTP server %s:%s", SMTP_HOST, SMTP_PORT)
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    try:
+        server.starttls()
+        logger.info("Logging in as %s", SMTP_USER)
+        server.login(SMTP_USER, SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _close_smtp(conn: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from a dead socket."""
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        conn.close()
+
+
+def _checkout_smtp() -> smtplib.SMTP:
+    """
+    Take a connection from the pool, reconnecting if it is no longer usable.
+
+    Blocks until a pool slot is free. The connection must be handed back
+    with _smtp_pool.put() once the caller is done with it.
+
+    Returns:
+        Connected SMTP client
+    """
+    conn = _smtp_pool.get()
+    try:
+        if conn is not None:
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("Pooled SMTP connection is stale, reconnecting")
+            _close_smtp(conn)
+        return _connect_smtp()
+    except BaseException:
+        _smtp_pool.put(None)
+        raise
+
+
+def _sendmail(recipients: Sequence[str], raw_message: bytes) -> None:
+    """
+    Send a serialized message over a pooled connection.
+
+    Reconnects once if the server dropped the connection between the health
+    check and the send.
+
+    Args:
+        recipients: Envelope recipient addresses
+        raw_message: Message serialized with the SMTP policy
+    """
+    conn = _checkout_smtp()
+    try:
+        try:
+            conn.sendmail(SMTP_FROM, recipients, raw_message)
+        except smtplib.SMTPServerDisconnected:
+            logger.warning("SMTP server disconnected, retrying with a new connection")
+            _close_smtp(conn)
+            conn = _connect_smtp()
+            conn.sendmail(SMTP_FROM, recipients, raw_message)
+    finally:
+        # A dead connection is fine here; the next checkout replaces it
+        _smtp_pool.put(conn)
+
+
+def send_email(recipients: Sequence[str], subject: str, html_content: bytes,
+               to_header: Optional[str] = None) -> List[str]:
     """
     Send HTML email via SMTP.
 
+    Large recipient lists are sent one copy per recipient, so some copies can
+    fail while others are delivered. Those failures are returned rather than
+    raised, so callers don't retry (and re-send to) recipients that already
+    got the email.
+
     Args:
-        recipients: List of recipient email addresses
+        recipients: Recipient email addresses
         subject: Email subject line
-        html_content: HTML content for email body
+        html_content: UTF-8 encoded HTML content for email body
+        to_header: Pre-joined To: header (joined from recipients if not provided)
+
+    Returns:
+        Recipients the email could not be delivered to (empty if all succeeded)
 
     Raises:
-        Exception: If email sending fails
+        Exception: If email sending fails for every recipient
     """
     if not recipients:
         raise ValueError("No recipients specified")
@@ -161,50 +414,84 @@ def send_email(recipients: List[str], subject: str, html_content: str) -> None:
     if not SMTP_USER or not SMTP_PASSWORD:
         raise ValueError("SMTP credentials not configured (SMTP_USER and SMTP_PASSWORD required)")
 
-    # Create message
-    msg = MIMEMultipart('alternative')
+    # Create message. Large recipient lists get one message per recipient,
+    # so the To: header is added per copy after serialization below.
+    per_recipient = len(recipients) > PER_RECIPIENT_THRESHOLD
+    msg = EmailMessage()
     msg['Subject'] = subject
     msg['From'] = SMTP_FROM
-    msg['To'] = ', '.join(recipients)
+    if not per_recipient:
+        msg['To'] = to_header or ', '.join(recipients)
+
+    # Single text/html body from already-encoded content; there is no plain
+    # text part, so a multipart/alternative wrapper would only add a boundary.
+    # Use msg.add_alternative() if a plain text fallback is ever added.
+    msg.set_content(html_content, maintype='text', subtype='html', params={'charset': 'utf-8'})
 
-    # Attach HTML content
-    html_part = MIMEText(html_content, 'html', 'utf-8')
-    msg.attach(html_part)
+    # Serialize once; sendmail skips send_message's re-generation and header
+    # parsing for recipient addresses
+    raw_message = msg.as_bytes(policy=policy.SMTP)
 
-    # Send email
     try:
-        logger.info(f"Connecting to SMTP server {SMTP_HOST}:{SMTP_PORT}")
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.starttls()
-            logger.info(f"Logging in as {SMTP_USER}")
-            server.login(SMTP_USER, SMTP_PASSWORD)
-            logger.info(f"Sending email to {len(recipients)} recipient(s)")
-            server.send_message(msg)
-            logger.info("Email sent successfully")
+        logger.info("Sending email to %s recipient(s)", len(recipients))
+        if per_recipient:
+            # One copy per recipient in parallel over the pool; this also keeps
+            # each recipient from seeing the rest of the list
+            futures = [
+                _send_executor.submit(
+                    _sendmail, (rcpt,), policy.SMTP.fold_binary('To', rcpt) + raw_message
+                )
+                for rcpt in recipients
+            ]
+            errors = [f.exception() for f in futures]
+            failed = [rcpt for rcpt, e in zip(recipients, errors) if e is not None]
+            if failed:
+                logger.error("Failed to send to %s of %s recipient(s)", len(failed), len(recipients))
+                if len(failed) == len(recipients):
+                    # Nothing was delivered, so the whole send can safely be retried
+                    raise next(e for e in errors if e is not None)
+                for rcpt, e in zip(recipients, errors):
+                    if e is not None:
+                        logger.error("Failed to send to %s: %s", rcpt, e)
+                return failed
+        else:
+            _sendmail(recipients, raw_message)
+        logger.info("Email sent successfully")
+        return []
     except smtplib.SMTPAuthenticationError:
         logger.error("SMTP authentication failed - check credentials")
         raise
     except smtplib.SMTPException as e:
-        logger.error(f"SMTP error: {e}")
+        logger.error("SMTP error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        logger.error("Failed to send email: %s", e)
         raise
 
 
+@app.on_event("shutdown")
+def close_smtp_connection():
+    """Close the pooled SMTP connections on shutdown."""
+    _send_executor.shutdown(wait=True)
+    for _ in range(SMTP_POOL_SIZE):
+        conn = _smtp_pool.get()
+        if conn is not None:
+            _close_smtp(conn)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Kubernetes probes."""
     return {
         "status": "healthy",
         "service": "notifier",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "smtp_configured": bool(SMTP_USER and SMTP_PASSWORD)
     }
 
 
-@app.post("/api/v1/notify")
-async def send_notification(request: NotifyRequest):
+@app.post("/api/v1/notify", openapi_extra=json_body_openapi(NotifyRequest))
+async def send_notification(request: NotifyRequest = Depends(json_body(NotifyRequest))):
     """
     Send incident report notification via email.
 
@@ -214,58 +501,66 @@ async def send_notification(request: NotifyRequest):
     Returns:
         Success response with sent details
     """
-    logger.info(f"Received notification request for alert: {request.alert_name}")
-    logger.info(f"Severity: {request.severity}, Namespace: {request.namespace}")
+    logger.info("Received notification request for alert: %s", request.alert_name)
+    logger.info("Severity: %s, Namespace: %s", request.severity, request.namespace)
 
     # Get recipients based on severity
     recipients = get_recipients_for_severity(request.severity)
 
     if not recipients:
-        logger.error(f"No recipients configured for severity: {request.severity}")
+        logger.error("No recipients configured for severity: %s", request.severity)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"No recipients configured for severity '{request.severity}'"
         )
 
     # Build email subject
-    severity_upper = request.severity.upper()
-    namespace_str = f" ({request.namespace})" if request.namespace else ""
-    subject = f"[{severity_upper}] {request.alert_name}{namespace_str}"
+    severity_upper = SEVERITY_LABELS[request.severity]
+    if request.namespace:
+        subject = "[%s] %s (%s)" % (severity_upper, request.alert_name, request.namespace)
+    else:
+        subject = "[%s] %s" % (severity_upper, request.alert_name)
 
     # Convert markdown to HTML
     try:
         html_content = markdown_to_html(request.report_markdown)
     except Exception as e:
-        logger.error(f"Failed to convert markdown to HTML: {e}")
+        logger.error("Failed to convert markdown to HTML: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process report: {e}"
         )
 
-    # Send email
+    # Send email on a worker thread so the SMTP dialog doesn't block the event loop
     try:
-        send_email(recipients, subject, html_content)
-        logger.info(f"Notification sent successfully to {len(recipients)} recipient(s)")
+        to_header = JOINED_RECIPIENTS[request.severity]
+        failed = await run_in_threadpool(send_email, recipients, subject, html_content, to_header)
+        if failed:
+            logger.warning("Notification sent to %s of %s recipient(s)",
+                           len(recipients) - len(failed), len(recipients))
+        else:
+            logger.info("Notification sent successfully to %s recipient(s)", len(recipients))
 
         return {
-            "success": True,
+            "success": not failed,
             "alert_name": request.alert_name,
             "severity": request.severity,
             "recipients": recipients,
+            "failed_recipients": failed,
             "subject": subject,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
 
     except Exception as e:
-        logger.error(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to send email: {str(e)}"
         )
 
 
-@app.post("/api/v1/test-email")
-async def send_test_email(request: TestEmailRequest):
+@app.post("/api/v1/test-email", openapi_extra=json_body_openapi(TestEmailRequest))
+async def send_test_email(request: TestEmailRequest = Depends(json_body(TestEmailRequest))):
     """
     Send a test email to verify SMTP configuration.
 
@@ -275,74 +570,34 @@ async def send_test_email(request: TestEmailRequest):
     Returns:
         Success response
     """
-    logger.info(f"Sending test email to {len(request.recipients)} recipient(s)")
-
-    # Build test email content
-    test_markdown = f"""
-# Test Email
-
-{request.test_message}
-
-## Configuration Test
-
-This is a test email from the DevOps RCA Notifier Service.
-
-**Timestamp:** {datetime.utcnow().isoformat()}
-
-**Recipients:** {', '.join(request.recipients)}
-
-**SMTP Server:** {SMTP_HOST}:{SMTP_PORT}
-
-**From:** {SMTP_FROM}
-
----
-
-If you received this email, your notifier service is configured correctly!
-
-## Sample Incident Report Format
-
-### Executive Summary
-This is what a real incident report would look like.
-
-### Timeline
-- 14:00 - Event 1
-- 14:01 - Event 2
-- 14:02 - Alert fired
-
-### Root Cause
-**Primary Cause:** Test scenario
-
-### Solutions
-
-#### Immediate Fix
-```bash
-kubectl get pods
-```
-
-#### Root Fix
-1. Step one
-2. Step two
-
----
-
-**Generated by:** DevOps RCA Notifier Service v0.1.0
-"""
-
-    html_content = markdown_to_html(test_markdown)
+    logger.info("Sending test email to %s recipient(s)", len(request.recipients))
+
+    # Build test email content; user-supplied values are escaped since they
+    # bypass the markdown converter
+    header_html = TEST_EMAIL_HEADER_TEMPLATE.substitute(
+        msg=html.escape(request.test_message or ''),
+        ts=_now_iso(),
+        rcpts=html.escape(', '.join(request.recipients)),
+    )
+    html_content = wrap_html(header_html + TEST_EMAIL_STATIC_HTML)
 
     try:
-        send_email(request.recipients, "[TEST] DevOps RCA Notifier", html_content)
-        logger.info("Test email sent successfully")
+        failed = await run_in_threadpool(send_email, request.recipients, "[TEST] DevOps RCA Notifier", html_content)
+        if failed:
+            logger.warning("Test email not delivered to %s recipient(s)", len(failed))
+        else:
+            logger.info("Test email sent successfully")
 
         return {
-            "success": True,
+            "success": not failed,
             "recipients": request.recipients,
-            "message": "Test email sent successfully",
-            "timestamp": datetime.utcnow().isoformat()
+            "failed_recipients": failed,
+            "message": "Test email sent with failures" if failed else "Test email sent successfully",
+            "timestamp": _now_iso()
         }
 
     except Exception as e:
-        logger.error(f"Failed to send test email: {e}")
+        logger.error("Failed to send test email: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to send test email: {str(e)}"
@@ -372,6 +627,26 @@ async def get_config():
     }
 
 
+@app.post("/api/v1/cache/clear")
+async def clear_render_cache():
+    """
+    Clear the rendered report cache (for debugging).
+
+    Returns:
+        Cache statistics before clearing
+    """
+    info = _render.cache_info()
+    _render.cache_clear()
+    logger.info("Cleared render cache (%s entries)", info.currsize)
+
+    return {
+        "cleared": info.currsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -385,5 +660,5 @@ if __name__ == "__main__":
 
     # Run server
     port = int(os.environ.get('PORT', 8080))
-    logger.info(f"Starting notifier service on port {port}")
+    logger.info("Starting notifier service on port %s", port)
     uvicorn.run(app, host="0.0.0.0", port=port)
@@ -5,13 +5,22 @@ Lightweight FastAPI service that receives AlertManager webhooks
 and triggers the Kagent AI agent for investigation.
 """
 
-from fastapi import FastAPI, HTTPException, Request
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Dict, List, Optional, Union
+import asyncio
 import httpx
+import orjson
 import logging
+import logging.handlers
 import os
-from datetime import datetime, timedelta
+import queue
+import string
+import time
+from collections import OrderedDict
+from datetime import datetime
 
 # Configure logging
 logging.basicConfig(
@@ -20,10 +29,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Try to import redis, but make it optional (only needed when REDIS_URL is set)
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 app = FastAPI(
     title="DevOps RCA Webhook Service",
     version="0.1.0",
-    description="Receives AlertManager webhooks and triggers RCA agent"
+    description="Receives AlertManager webhooks and triggers RCA agent",
+    default_response_class=ORJSONResponse
 )
 
 # Configuration
@@ -32,9 +49,34 @@ KAGENT_API_URL = os.getenv(
     "http://kagent-api.analysis-agent.svc.cluster.local/api/v1/agents/devops-rca-agent/invoke"
 )
 
-# Simple in-memory cache for alert deduplication (TTL: 5 minutes)
-recent_alerts = {}
-ALERT_CACHE_TTL = timedelta(minutes=5)
+# Shared dedup store for multiple replicas; the in-memory cache below is used
+# when it is not configured
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+# In-memory cache for alert deduplication (TTL: 5 minutes), kept in insertion
+# order so the oldest entries are always at the front. Timestamps are
+# time.monotonic() seconds, unaffected by wall-clock adjustments.
+recent_alerts: "OrderedDict[Union[int, str], float]" = OrderedDict()
+ALERT_CACHE_TTL_S = 300.0
+ALERT_CACHE_MAX_SIZE = int(os.getenv("ALERT_CACHE_MAX_SIZE", "10000"))
+ALERT_CACHE_CLEANUP_INTERVAL_S = 60.0
+
+# Agent responses larger than this are discarded instead of being loaded into memory
+AGENT_MAX_RESPONSE_BYTES = int(os.getenv("AGENT_MAX_RESPONSE_BYTES", str(8 * 1024 * 1024)))
+
+# Agent investigations run on background workers fed by an in-process queue,
+# so the webhook can acknowledge AlertManager without waiting on the agent.
+# The worker count is also the cap on concurrent agent calls, however many
+# alerts arrive at once.
+INVESTIGATION_WORKERS = max(1, int(os.getenv("INVESTIGATION_WORKERS", "10")))
+INVESTIGATION_QUEUE_SIZE = int(os.getenv("INVESTIGATION_QUEUE_SIZE", "1000"))
+
+# Fingerprints queued or under investigation. An investigation can outlive the
+# dedup TTL (queue wait plus up to 300s of agent time), so these are treated as
+# duplicates until their worker finishes.
+investigations_in_flight: set = set()
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 
 # Pydantic models for AlertManager webhook format
@@ -62,6 +104,145 @@ class AlertManagerWebhook(BaseModel):
     alerts: List[Alert]
 
 
+def json_body(model: type[BaseModel]):
+    """
+    Build a dependency that validates the raw request body against a model
+
+    pydantic-core parses the JSON bytes directly, skipping the intermediate
+    dict FastAPI would otherwise build with the stdlib json module.
+
+    Args:
+        model: Request model class
+
+    Returns:
+        FastAPI dependency returning a validated model instance
+    """
+    async def parse(request: Request):
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            errors = [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors, body=body)
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict:
+    """OpenAPI request body for routes using json_body()"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
+@app.on_event("startup")
+def start_log_listener():
+    """
+    Route root log records through a queue to a background thread
+
+    Handlers write to stderr synchronously; behind a QueueHandler the event
+    loop only enqueues records and a QueueListener thread does the I/O.
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    app.state.log_handlers = root.handlers[:]
+    app.state.log_listener = logging.handlers.QueueListener(
+        log_queue, *app.state.log_handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    app.state.log_listener.start()
+
+
+@app.on_event("startup")
+async def create_kagent_client():
+    """Create the shared Kagent API client so connections are kept alive across alerts"""
+    app.state.kagent_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(300.0, connect=5.0),
+        # One connection per worker: the pool never waits or idles
+        limits=httpx.Limits(
+            max_keepalive_connections=INVESTIGATION_WORKERS,
+            max_connections=INVESTIGATION_WORKERS
+        ),
+        headers={"Content-Type": "application/json"}
+    )
+
+
+@app.on_event("startup")
+async def start_investigation_workers():
+    """Start the background workers that invoke the agent for queued alerts"""
+    app.state.investigation_queue = asyncio.Queue(maxsize=INVESTIGATION_QUEUE_SIZE)
+    app.state.investigation_workers = [
+        asyncio.create_task(investigation_worker(app.state.investigation_queue))
+        for _ in range(INVESTIGATION_WORKERS)
+    ]
+
+
+@app.on_event("shutdown")
+async def stop_investigation_workers():
+    """Cancel the investigation workers before the Kagent client is closed"""
+    for worker in app.state.investigation_workers:
+        worker.cancel()
+    await asyncio.gather(*app.state.investigation_workers, return_exceptions=True)
+
+    pending = app.state.investigation_queue.qsize()
+    if pending:
+        logger.warning("Dropping %s queued investigation(s) on shutdown", pending)
+
+
+@app.on_event("shutdown")
+async def close_kagent_client():
+    """Close the shared Kagent API client"""
+    await app.state.kagent_client.aclose()
+
+
+@app.on_event("startup")
+async def create_redis_client():
+    """Connect the Redis dedup store if REDIS_URL is configured"""
+    app.state.redis = None
+    if not REDIS_URL:
+        return
+
+    if not REDIS_AVAILABLE:
+        logger.warning("REDIS_URL is set but the redis library is not installed, using in-memory dedup")
+        return
+
+    app.state.redis = aioredis.from_url(REDIS_URL)
+    logger.info("Using Redis for alert deduplication")
+
+
+@app.on_event("shutdown")
+async def close_redis_client():
+    """Close the Redis dedup store connection"""
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+
+
+@app.on_event("startup")
+async def start_cache_janitor():
+    """Start the background task that expires in-memory dedup entries"""
+    app.state.cache_janitor = asyncio.create_task(cache_janitor())
+
+
+@app.on_event("shutdown")
+async def stop_cache_janitor():
+    """Stop the dedup cache janitor"""
+    app.state.cache_janitor.cancel()
+    await asyncio.gather(app.state.cache_janitor, return_exceptions=True)
+
+
+@app.on_event("shutdown")
+def stop_log_listener():
+    """Flush queued log records and restore the direct handlers"""
+    app.state.log_listener.stop()
+    logging.getLogger().handlers = app.state.log_handlers
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API information"""
@@ -87,68 +268,76 @@ async def health_check():
     }
 
 
-@app.post("/api/v1/webhook/alertmanager")
-async def receive_alertmanager_webhook(webhook: AlertManagerWebhook):
+@app.post(
+    "/api/v1/webhook/alertmanager",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=json_body_openapi(AlertManagerWebhook)
+)
+async def receive_alertmanager_webhook(
+    webhook: AlertManagerWebhook = Depends(json_body(AlertManagerWebhook))
+):
     """
     Main webhook endpoint for AlertManager
 
-    Receives alerts, deduplicates, and triggers agent investigation
+    Receives alerts, deduplicates, and queues agent investigations.
+    Returns 202 as soon as the alerts are queued.
     """
-    logger.info(f"Received webhook - GroupKey: {webhook.groupKey}, Status: {webhook.status}")
-    logger.info(f"Number of alerts: {len(webhook.alerts)}")
-
-    # Clean expired alerts from cache
-    cleanup_alert_cache()
+    logger.info("Received webhook - GroupKey: %s, Status: %s", webhook.groupKey, webhook.status)
+    logger.info("Number of alerts: %s", len(webhook.alerts))
 
-    # Process each alert
+    # Queue firing, non-duplicate alerts for investigation
+    investigations = app.state.investigation_queue
     results = []
+    queued = 0
     for alert in webhook.alerts:
+        # Only process firing alerts
+        if alert.status != "firing":
+            logger.info("Skipping non-firing alert: %s (status: %s)", alert.fingerprint, alert.status)
+            continue
+
+        # Check for duplicates and mark the alert as processed
+        if not await claim_alert(alert.fingerprint):
+            logger.info("Skipping duplicate alert: %s", alert.fingerprint)
+            continue
+
+        # Log alert details
+        alert_name = alert.labels.get('alertname', 'Unknown')
+        severity = alert.labels.get('severity', 'unknown')
+        namespace = alert.labels.get('namespace', 'unknown')
+
+        logger.info("Processing alert: %s", alert_name)
+        logger.info("  Severity: %s", severity)
+        logger.info("  Namespace: %s", namespace)
+        logger.info("  Fingerprint: %s", alert.fingerprint)
+
         try:
-            # Only process firing alerts
-            if alert.status != "firing":
-                logger.info(f"Skipping non-firing alert: {alert.fingerprint} (status: {alert.status})")
-                continue
-
-            # Check for duplicates
-            if is_duplicate_alert(alert.fingerprint):
-                logger.info(f"Skipping duplicate alert: {alert.fingerprint}")
-                continue
-
-            # Mark alert as processed
-            recent_alerts[alert.fingerprint] = datetime.utcnow()
-
-            # Log alert details
-            alert_name = alert.labels.get('alertname', 'Unknown')
-            severity = alert.labels.get('severity', 'unknown')
-            namespace = alert.labels.get('namespace', 'unknown')
-
-            logger.info(f"Processing alert: {alert_name}")
-            logger.info(f"  Severity: {severity}")
-            logger.info(f"  Namespace: {namespace}")
-            logger.info(f"  Fingerprint: {alert.fingerprint}")
-
-            # Trigger agent investigation
-            result = await trigger_agent_investigation(alert, webhook)
+            investigations.put_nowait((alert, webhook))
+            investigations_in_flight.add(dedup_key(alert.fingerprint))
+        except asyncio.QueueFull:
+            # Release the claim so AlertManager's next notification retries it
+            logger.error("Investigation queue full, dropping alert: %s", alert.fingerprint)
+            await release_alert(alert.fingerprint)
             results.append({
                 "fingerprint": alert.fingerprint,
                 "alertname": alert_name,
-                "status": "triggered",
-                "result": result
+                "status": "dropped",
+                "error": "Investigation queue full"
             })
+            continue
 
-        except Exception as e:
-            logger.error(f"Error processing alert {alert.fingerprint}: {e}", exc_info=True)
-            results.append({
-                "fingerprint": alert.fingerprint,
-                "status": "error",
-                "error": str(e)
-            })
+        queued += 1
+        results.append({
+            "fingerprint": alert.fingerprint,
+            "alertname": alert_name,
+            "status": "queued"
+        })
 
     return {
-        "status": "processed",
+        "status": "accepted",
         "webhook_group": webhook.groupKey,
         "alerts_received": len(webhook.alerts),
         "alerts_processed": len(results),
+        "alerts_queued": queued,
         "results": results
     }
 
@@ -161,7 +350,7 @@ async def test_webhook(request: Request):
     Useful for testing without AlertManager
     """
     body = await request.json()
-    logger.info(f"Test webhook received: {body}")
+    logger.info("Test webhook received: %s", body)
 
     return {
         "status": "test_received",
@@ -170,13 +359,59 @@ async def test_webhook(request: Request):
     }
 
 
-async def trigger_agent_investigation(alert: Alert, webhook: AlertManagerWebhook):
+async def investigation_worker(investigations: asyncio.Queue):
+    """
+    Invoke the agent for queued alerts until cancelled
+
+    Args:
+        investigations: Queue of (alert, webhook) pairs to investigate
+    """
+    while True:
+        alert, webhook = await investigations.get()
+        try:
+            result = await trigger_agent_investigation(alert, webhook, app.state.kagent_client)
+            if isinstance(result, dict) and result.get("status") in ("error", "timeout"):
+                logger.warning("Investigation failed for alert %s: %s", alert.fingerprint, result.get('error'))
+            else:
+                logger.info("Investigation completed for alert %s", alert.fingerprint)
+        except Exception as e:
+            logger.error("Error processing alert %s: %s", alert.fingerprint, e, exc_info=True)
+        finally:
+            investigations_in_flight.discard(dedup_key(alert.fingerprint))
+            investigations.task_done()
+
+
+async def read_limited(response: httpx.Response, limit: int) -> Optional[bytes]:
+    """
+    Read a streamed response body, giving up once it exceeds limit bytes
+
+    Args:
+        response: Response opened with client.stream()
+        limit: Maximum body size in bytes
+
+    Returns:
+        Body bytes, or None if the body is larger than limit
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        return None
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > limit:
+            return None
+    return bytes(body)
+
+
+async def trigger_agent_investigation(alert: Alert, webhook: AlertManagerWebhook, client: httpx.AsyncClient):
     """
     Trigger the Kagent agent to investigate an alert
 
     Args:
         alert: The alert to investigate
         webhook: Full webhook context
+        client: Shared Kagent API client
 
     Returns:
         Response from agent invocation
@@ -184,83 +419,63 @@ async def trigger_agent_investigation(alert: Alert, webhook: AlertManagerWebhook
     # Build detailed investigation prompt for the agent
     prompt = build_investigation_prompt(alert, webhook)
 
-    logger.info(f"Triggering agent investigation for alert: {alert.labels.get('alertname', 'Unknown')}")
-    logger.debug(f"Agent prompt length: {len(prompt)} characters")
+    logger.info("Triggering agent investigation for alert: %s", alert.labels.get('alertname', 'Unknown'))
+    logger.debug("Agent prompt length: %s characters", len(prompt))
 
     try:
-        # Call Kagent agent API
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(
-                KAGENT_API_URL,
-                json={"prompt": prompt},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            logger.info("Agent investigation triggered successfully")
-            return response.json()
+        # Call Kagent agent API over the pooled connection, streaming the
+        # response so an oversized body is never held in memory
+        async with client.stream("POST", KAGENT_API_URL, json={"prompt": prompt}) as response:
+            body = await read_limited(response, AGENT_MAX_RESPONSE_BYTES)
+
+        if body is None:
+            logger.error("Agent response exceeded %s bytes", AGENT_MAX_RESPONSE_BYTES)
+            return {"status": "error", "error": f"Agent response exceeded {AGENT_MAX_RESPONSE_BYTES} bytes"}
+
+        if response.is_error:
+            text = body.decode("utf-8", errors="replace")
+            logger.error("Agent API returned error status: %s", response.status_code)
+            logger.error("Response: %s", text)
+            return {
+                "status": "error",
+                "error": f"HTTP {response.status_code}",
+                "details": text
+            }
+
+        logger.info("Agent investigation triggered successfully")
+        return orjson.loads(body)
 
     except httpx.TimeoutException:
         logger.error("Agent investigation timed out (300s)")
         return {"status": "timeout", "error": "Agent investigation timed out"}
 
-    except httpx.HTTPStatusError as e:
-        logger.error(f"Agent API returned error status: {e.response.status_code}")
-        logger.error(f"Response: {e.response.text}")
-        return {
-            "status": "error",
-            "error": f"HTTP {e.response.status_code}",
-            "details": e.response.text
-        }
-
     except Exception as e:
-        logger.error(f"Failed to invoke agent: {e}", exc_info=True)
+        logger.error("Failed to invoke agent: %s", e, exc_info=True)
         return {"status": "error", "error": str(e)}
 
 
-def build_investigation_prompt(alert: Alert, webhook: AlertManagerWebhook) -> str:
-    """
-    Build a detailed investigation prompt for the agent
-
-    Args:
-        alert: The alert details
-        webhook: Full webhook context
-
-    Returns:
-        Formatted prompt string
-    """
-    alert_name = alert.labels.get('alertname', 'Unknown')
-    severity = alert.labels.get('severity', 'unknown')
-    namespace = alert.labels.get('namespace', 'unknown')
-    pod = alert.labels.get('pod', 'unknown')
-
-    # Format labels
-    labels_str = "\n".join([f"  {k}: {v}" for k, v in alert.labels.items()])
-
-    # Format annotations
-    annotations_str = "\n".join([f"  {k}: {v}" for k, v in alert.annotations.items()])
-
-    prompt = f"""ALERT RECEIVED - INVESTIGATE AND ANALYZE
+# Investigation prompt, parsed once at import and filled in per alert
+INVESTIGATION_PROMPT_TEMPLATE = string.Template("""ALERT RECEIVED - INVESTIGATE AND ANALYZE
 
-Alert Name: {alert_name}
-Severity: {severity}
-Status: {alert.status}
-Started At: {alert.startsAt}
-Fingerprint: {alert.fingerprint}
+Alert Name: $alert_name
+Severity: $severity
+Status: $status
+Started At: $starts_at
+Fingerprint: $fingerprint
 
 ALERT LABELS:
-{labels_str}
+$labels
 
 ALERT ANNOTATIONS:
-{annotations_str}
+$annotations
 
 GENERATOR URL:
-{alert.generatorURL}
+$generator_url
 
 CONTEXT:
-- Namespace: {namespace}
-- Pod: {pod}
-- Group Key: {webhook.groupKey}
+- Namespace: $namespace
+- Pod: $pod
+- Group Key: $group_key
 
 INSTRUCTIONS FOR MVP PHASE:
 
@@ -284,9 +499,108 @@ For this MVP phase, focus on analysis and recommendations.
 Full automated investigation will be added in Phase 3.
 
 Begin your analysis now.
-"""
+""")
 
-    return prompt
+
+def build_investigation_prompt(alert: Alert, webhook: AlertManagerWebhook) -> str:
+    """
+    Build a detailed investigation prompt for the agent
+
+    Args:
+        alert: The alert details
+        webhook: Full webhook context
+
+    Returns:
+        Formatted prompt string
+    """
+    labels = alert.labels
+
+    return INVESTIGATION_PROMPT_TEMPLATE.substitute(
+        alert_name=labels.get('alertname', 'Unknown'),
+        severity=labels.get('severity', 'unknown'),
+        status=alert.status,
+        starts_at=alert.startsAt,
+        fingerprint=alert.fingerprint,
+        labels=format_dict(labels),
+        annotations=format_dict(alert.annotations),
+        generator_url=alert.generatorURL,
+        namespace=labels.get('namespace', 'unknown'),
+        pod=labels.get('pod', 'unknown'),
+        group_key=webhook.groupKey
+    )
+
+
+async def claim_alert(fingerprint: str) -> bool:
+    """
+    Mark an alert as processed unless it was already seen within the TTL
+
+    Alerts still queued or under investigation are always duplicates. With
+    Redis the check and insert are a single atomic SET NX, shared by all
+    replicas and expired server-side. Falls back to the in-memory cache when
+    Redis is not configured or unreachable; there the check and insert run
+    without an await in between, so concurrent webhooks cannot both claim
+    the same fingerprint and no lock is needed.
+
+    Args:
+        fingerprint: Alert fingerprint from AlertManager
+
+    Returns:
+        True if the alert is new and should be processed
+    """
+    if dedup_key(fingerprint) in investigations_in_flight:
+        return False
+
+    redis = app.state.redis
+    if redis is not None:
+        try:
+            return bool(await redis.set(
+                f"alert:{fingerprint}", "1",
+                nx=True, ex=int(ALERT_CACHE_TTL_S)
+            ))
+        except aioredis.RedisError as e:
+            logger.warning("Redis dedup failed, falling back to in-memory cache: %s", e)
+
+    if is_duplicate_alert(fingerprint):
+        return False
+
+    mark_alert_processed(fingerprint)
+    return True
+
+
+async def release_alert(fingerprint: str):
+    """
+    Forget a claimed alert so it is processed again on the next notification
+
+    Args:
+        fingerprint: Alert fingerprint from AlertManager
+    """
+    redis = app.state.redis
+    if redis is not None:
+        try:
+            await redis.delete(f"alert:{fingerprint}")
+        except aioredis.RedisError as e:
+            logger.warning("Redis dedup release failed: %s", e)
+
+    recent_alerts.pop(dedup_key(fingerprint), None)
+
+
+def dedup_key(fingerprint: str) -> Union[int, str]:
+    """
+    Compact in-memory dedup key for a fingerprint
+
+    AlertManager fingerprints are 16 hex digits and fit a 64-bit int, which
+    is smaller than the string and cheaper to hash and compare. Anything
+    else (e.g. test fingerprints) is kept as the string itself.
+
+    Args:
+        fingerprint: Alert fingerprint from AlertManager
+
+    Returns:
+        Integer value of the fingerprint, or the fingerprint unchanged
+    """
+    if len(fingerprint) == 16 and _HEX_DIGITS.issuperset(fingerprint):
+        return int(fingerprint, 16)
+    return fingerprint
 
 
 def is_duplicate_alert(fingerprint: str) -> bool:
@@ -299,31 +613,60 @@ def is_duplicate_alert(fingerprint: str) -> bool:
     Returns:
         True if alert was recently processed
     """
-    if fingerprint in recent_alerts:
+    key = dedup_key(fingerprint)
+    alert_time = recent_alerts.get(key)
+    if alert_time is not None:
         # Check if alert is still within TTL
-        alert_time = recent_alerts[fingerprint]
-        if datetime.utcnow() - alert_time < ALERT_CACHE_TTL:
+        if time.monotonic() - alert_time < ALERT_CACHE_TTL_S:
             return True
         else:
             # Expired, remove from cache
-            del recent_alerts[fingerprint]
+            del recent_alerts[key]
 
     return False
 
 
+def mark_alert_processed(fingerprint: str):
+    """
+    Record an alert as processed, evicting the oldest entries beyond the size cap
+
+    Args:
+        fingerprint: Alert fingerprint from AlertManager
+    """
+    key = dedup_key(fingerprint)
+    recent_alerts[key] = time.monotonic()
+    recent_alerts.move_to_end(key)
+
+    while len(recent_alerts) > ALERT_CACHE_MAX_SIZE:
+        recent_alerts.popitem(last=False)
+
+
+async def cache_janitor():
+    """
+    Periodically remove expired alerts from the in-memory cache
+
+    Runs off the request path; is_duplicate_alert still checks the TTL of
+    the entry it looks up, so stale entries between sweeps are harmless.
+    """
+    while True:
+        await asyncio.sleep(ALERT_CACHE_CLEANUP_INTERVAL_S)
+        cleanup_alert_cache()
+
+
 def cleanup_alert_cache():
     """Remove expired alerts from the cache"""
-    now = datetime.utcnow()
-    expired = [
-        fp for fp, timestamp in recent_alerts.items()
-        if now - timestamp >= ALERT_CACHE_TTL
-    ]
-
-    for fp in expired:
+    # Entries are ordered oldest first, so stop at the first one still fresh
+    now = time.monotonic()
+    expired = 0
+    while recent_alerts:
+        fp = next(iter(recent_alerts))
+        if now - recent_alerts[fp] < ALERT_CACHE_TTL_S:
+            break
         del recent_alerts[fp]
+        expired += 1
 
     if expired:
-        logger.debug(f"Cleaned up {len(expired)} expired alerts from cache")
+        logger.debug("Cleaned up %s expired alerts from cache", expired)
 
 
 def format_dict(d: Dict) -> str:
@@ -336,7 +679,7 @@ def format_dict(d: Dict) -> str:
     Returns:
         Formatted string
     """
-    return "\n".join([f"  {k}: {v}" for k, v in d.items()])
+    return "\n".join(f"  {k}: {v}" for k, v in d.items())
 
 
 if __name__ == "__main__":
@@ -344,12 +687,14 @@ if __name__ == "__main__":
 
     port = int(os.getenv("PORT", "8080"))
 
-    logger.info(f"Starting webhook service on port {port}")
-    logger.info(f"Kagent API URL: {KAGENT_API_URL}")
+    logger.info("Starting webhook service on port %s", port)
+    logger.info("Kagent API URL: %s", KAGENT_API_URL)
 
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=port,
+        loop="uvloop",
+        http="httptools",
         log_level=os.getenv("LOG_LEVEL", "info").lower()
     )
@@ -15,13 +15,14 @@ __version__ = "0.1.0"
 
 # Import tool functions for easy access
 from .memory_manager import memory_tool
-from .helm_analyzer import helm_tool
+from .helm_analyzer import helm_tool, helm_tool_async
 from .log_analyzer import log_tool
 from .github_api import github_tool
 
 __all__ = [
     "memory_tool",
     "helm_tool",
+    "helm_tool_async",
     "log_tool",
     "github_tool",
 ]
@@ -12,23 +12,104 @@ Requires GitHub personal access token configured in environment or Kubernetes se
 
 import os
 import json
-from typing import List, Dict, Optional, Any
+import time
+import asyncio
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import requests, but make it optional
+# Try to import httpx, but make it optional
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
-    logger.warning("requests library not available, GitHub API tool will have limited functionality")
+    HTTPX_AVAILABLE = False
+    logger.warning("httpx library not available, GitHub API tool will have limited functionality")
 
+GITHUB_API_URL = "https://api.github.com"
 
-class GitHubAPI:
-    """GitHub API client for RCA investigations."""
+# Largest page size GitHub list endpoints accept
+MAX_PER_PAGE = 100
+
+# Responses larger than this are rejected instead of being loaded into memory
+MAX_RESPONSE_BYTES = int(os.environ.get('GITHUB_MAX_RESPONSE_BYTES', str(8 * 1024 * 1024)))
+
+# Files listed by get_commit_details; only this many are requested
+COMMIT_FILES_LIMIT = 20
+
+# Workflow run conclusions reported by get_failed_workflows
+FAILED_CONCLUSIONS = ('failure', 'timed_out', 'cancelled')
+
+# Conditional-GET cache: responses are kept with their ETag and revalidated
+# with If-None-Match. A 304 costs no rate limit quota and carries no body.
+ETAG_CACHE_MAX_SIZE = 512
+ETAG_CACHE_TTL = 300  # seconds
+_etag_cache: "OrderedDict[Tuple, Tuple[str, Any, Optional[str], float]]" = OrderedDict()
+
+# Shared client so consecutive GitHub calls reuse pooled keep-alive connections.
+# Created lazily inside the running event loop (see _get_client).
+_client: Optional["httpx.AsyncClient"] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Cap on concurrent GitHub requests, to stay clear of secondary rate limits
+# when calls are fanned out (see get_rca_bundle)
+MAX_CONCURRENT_REQUESTS = 5
+_request_sem: Optional[asyncio.Semaphore] = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """
+    Return the shared GitHub HTTP client, creating it on first use.
+
+    Pooled connections are bound to the event loop that opened them, so a
+    new client is created if the tool is called from a different loop.
+
+    Returns:
+        Shared httpx.AsyncClient for api.github.com
+    """
+    global _client, _client_loop, _request_sem
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={'Accept': 'application/vnd.github.v3+json'},
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=50),
+        )
+        _client_loop = loop
+        _request_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _client
+
+
+async def _read_limited(response: "httpx.Response", limit: int) -> Optional[bytes]:
+    """
+    Read a streamed response body, giving up once it exceeds limit bytes.
+
+    Args:
+        response: Response opened with client.stream()
+        limit: Maximum body size in bytes
+
+    Returns:
+        Body bytes, or None if the body is larger than limit
+    """
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        return None
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > limit:
+            return None
+    return bytes(body)
+
+
+class AsyncGitHubAPI:
+    """Async GitHub API client for RCA investigations."""
 
     def __init__(self, token: Optional[str] = None):
         """
@@ -38,52 +119,135 @@ class GitHubAPI:
             token: GitHub personal access token (reads from GITHUB_TOKEN env var if not provided)
         """
         self.token = token or os.environ.get('GITHUB_TOKEN', '')
-        self.base_url = "https://api.github.com"
-        self.headers = {
-            'Accept': 'application/vnd.github.v3+json',
-        }
+        self.headers = {}
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> tuple[Optional[Any], Optional[str]]:
+    async def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> tuple[Optional[Any], Optional[str], Optional[str]]:
         """
-        Make a request to GitHub API.
+        Make a request to GitHub API and return the next page link.
 
         Args:
-            endpoint: API endpoint (e.g., '/repos/owner/repo/commits')
+            endpoint: API endpoint (e.g., '/repos/owner/repo/commits') or absolute URL
             params: Query parameters
 
         Returns:
-            Tuple of (response_data, error_message)
+            Tuple of (response_data, next_page_url, error_message)
         """
-        if not REQUESTS_AVAILABLE:
-            return None, "ERROR: requests library not installed. Install with: pip install requests"
+        if not HTTPX_AVAILABLE:
+            return None, None, "ERROR: httpx library not installed. Install with: pip install httpx"
 
-        url = f"{self.base_url}{endpoint}"
+        # Same URL seen by a different token may differ, so the token is part of the key
+        cache_key = (self.token, endpoint, tuple(sorted((params or {}).items())))
+        cached = _etag_cache.get(cache_key)
+        if cached is not None and cached[3] <= time.monotonic():
+            del _etag_cache[cache_key]
+            cached = None
+
+        headers = self.headers
+        if cached is not None:
+            headers = {**headers, 'If-None-Match': cached[0]}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            client = _get_client()
+            async with _request_sem:
+                async with client.stream('GET', endpoint, headers=headers, params=params) as response:
+                    body = await _read_limited(response, MAX_RESPONSE_BYTES)
+
+            if response.status_code == 304 and cached is not None:
+                _etag_cache.move_to_end(cache_key)
+                return cached[1], cached[2], None
 
             if response.status_code == 401:
-                return None, "ERROR: GitHub API authentication failed. Check GITHUB_TOKEN."
+                return None, None, "ERROR: GitHub API authentication failed. Check GITHUB_TOKEN."
 
             if response.status_code == 404:
-                return None, f"ERROR: Resource not found: {endpoint}"
+                return None, None, f"ERROR: Resource not found: {endpoint}"
 
             if response.status_code == 403:
-                return None, "ERROR: GitHub API rate limit exceeded or access forbidden."
+                return None, None, "ERROR: GitHub API rate limit exceeded or access forbidden."
+
+            if body is None:
+                return None, None, f"ERROR: GitHub API response for {endpoint} exceeds {MAX_RESPONSE_BYTES} bytes"
 
             if response.status_code != 200:
-                return None, f"ERROR: GitHub API returned status {response.status_code}: {response.text}"
+                text = body.decode('utf-8', errors='replace')
+                return None, None, f"ERROR: GitHub API returned status {response.status_code}: {text}"
 
-            return response.json(), None
+            data = json.loads(body)
+            next_url = response.links.get('next', {}).get('url')
 
-        except requests.RequestException as e:
-            return None, f"ERROR: Failed to connect to GitHub API: {e}"
+            etag = response.headers.get('ETag')
+            if etag:
+                _etag_cache[cache_key] = (etag, data, next_url, time.monotonic() + ETAG_CACHE_TTL)
+                _etag_cache.move_to_end(cache_key)
+                if len(_etag_cache) > ETAG_CACHE_MAX_SIZE:
+                    _etag_cache.popitem(last=False)
+
+            return data, next_url, None
+
+        except httpx.HTTPError as e:
+            return None, None, f"ERROR: Failed to connect to GitHub API: {e}"
         except json.JSONDecodeError as e:
-            return None, f"ERROR: Failed to parse GitHub API response: {e}"
+            return None, None, f"ERROR: Failed to parse GitHub API response: {e}"
 
-    def get_recent_commits(self, owner: str, repo: str, branch: str = "main", limit: int = 10, since_hours: Optional[int] = None) -> str:
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> tuple[Optional[Any], Optional[str]]:
+        """
+        Make a request to GitHub API.
+
+        Args:
+            endpoint: API endpoint (e.g., '/repos/owner/repo/commits')
+            params: Query parameters
+
+        Returns:
+            Tuple of (response_data, error_message)
+        """
+        data, _, error = await self._fetch(endpoint, params)
+        return data, error
+
+    async def _paginate(self, endpoint: str, params: Dict, max_items: int,
+                        items_key: Optional[str] = None) -> tuple[Optional[List[Any]], Optional[str]]:
+        """
+        Collect up to max_items from a paginated list endpoint.
+
+        Pages are requested with the largest page size that is still needed
+        and followed through the Link header until enough items are collected.
+
+        Args:
+            endpoint: API endpoint of a list resource
+            params: Query parameters (per_page is set here)
+            max_items: Maximum number of items to return (int or numeric string)
+            items_key: Key holding the items when the response is an object
+                (e.g. 'workflow_runs'); the response itself is the list otherwise
+
+        Returns:
+            Tuple of (items, error_message)
+        """
+        try:
+            max_items = int(max_items)
+        except (TypeError, ValueError):
+            return None, f"ERROR: limit must be an integer, got {max_items!r}"
+
+        items: List[Any] = []
+        url: Optional[str] = endpoint
+        page_params: Optional[Dict] = {**params, 'per_page': min(max_items, MAX_PER_PAGE)}
+
+        while url and len(items) < max_items:
+            data, url, error = await self._fetch(url, page_params)
+            if error:
+                return None, error
+
+            page = data.get(items_key, []) if items_key else data
+            if not page:
+                break
+            items.extend(page[:max_items - len(items)])
+
+            # The next link already carries the query string
+            page_params = None
+
+        return items, None
+
+    async def get_recent_commits(self, owner: str, repo: str, branch: str = "main", limit: int = 10, since_hours: Optional[int] = None) -> str:
         """
         Get recent commits for a repository.
 
@@ -98,16 +262,13 @@ class GitHubAPI:
             Formatted commit history or error message
         """
         endpoint = f"/repos/{owner}/{repo}/commits"
-        params = {
-            'sha': branch,
-            'per_page': limit,
-        }
+        params = {'sha': branch}
 
         if since_hours:
             since_time = datetime.utcnow() - timedelta(hours=since_hours)
             params['since'] = since_time.isoformat() + 'Z'
 
-        data, error = self._make_request(endpoint, params)
+        data, error = await self._paginate(endpoint, params, limit)
 
         if error:
             return error
@@ -115,8 +276,8 @@ class GitHubAPI:
         if not data:
             return f"No commits found in {owner}/{repo} on branch {branch}"
 
-        result = f"# Recent Commits: {owner}/{repo} (branch: {branch})\n\n"
-        result += f"Showing {len(data)} commit(s):\n\n"
+        parts = [f"# Recent Commits: {owner}/{repo} (branch: {branch})\n\n"]
+        parts.append(f"Showing {len(data)} commit(s):\n\n")
 
         for commit in data:
             sha = commit['sha'][:7]
@@ -125,14 +286,14 @@ class GitHubAPI:
             date = commit['commit']['author']['date']
             url = commit['html_url']
 
-            result += f"- **{sha}** - {message}\n"
-            result += f"  - Author: {author}\n"
-            result += f"  - Date: {date}\n"
-            result += f"  - URL: {url}\n\n"
+            parts.append(f"- **{sha}** - {message}\n")
+            parts.append(f"  - Author: {author}\n")
+            parts.append(f"  - Date: {date}\n")
+            parts.append(f"  - URL: {url}\n\n")
 
-        return result
+        return "".join(parts)
 
-    def get_commit_details(self, owner: str, repo: str, commit_sha: str) -> str:
+    async def get_commit_details(self, owner: str, repo: str, commit_sha: str) -> str:
         """
         Get detailed information about a specific commit.
 
@@ -146,36 +307,41 @@ class GitHubAPI:
         """
         endpoint = f"/repos/{owner}/{repo}/commits/{commit_sha}"
 
-        data, error = self._make_request(endpoint)
+        # The commit endpoint paginates its files list, so only the files that
+        # are shown get transferred; a next page means more files changed
+        data, more_files, error = await self._fetch(endpoint, {'per_page': COMMIT_FILES_LIMIT})
 
         if error:
             return error
 
-        result = f"# Commit Details: {commit_sha[:7]}\n\n"
-        result += f"**Repository:** {owner}/{repo}\n"
-        result += f"**Author:** {data['commit']['author']['name']} <{data['commit']['author']['email']}>\n"
-        result += f"**Date:** {data['commit']['author']['date']}\n"
-        result += f"**Message:**\n```\n{data['commit']['message']}\n```\n\n"
+        parts = [f"# Commit Details: {commit_sha[:7]}\n\n"]
+        parts.append(f"**Repository:** {owner}/{repo}\n")
+        parts.append(f"**Author:** {data['commit']['author']['name']} <{data['commit']['author']['email']}>\n")
+        parts.append(f"**Date:** {data['commit']['author']['date']}\n")
+        parts.append(f"**Message:**\n```\n{data['commit']['message']}\n```\n\n")
 
         # Files changed
-        files = data.get('files', [])
+        files = data.get('files', [])[:COMMIT_FILES_LIMIT]
         if files:
-            result += f"**Files Changed ({len(files)}):**\n"
-            for file in files[:20]:  # Limit to first 20 files
+            if more_files:
+                parts.append(f"**Files Changed (first {len(files)}):**\n")
+            else:
+                parts.append(f"**Files Changed ({len(files)}):**\n")
+            for file in files:
                 status = file['status']
                 filename = file['filename']
                 additions = file.get('additions', 0)
                 deletions = file.get('deletions', 0)
-                result += f"- [{status}] {filename} (+{additions}/-{deletions})\n"
+                parts.append(f"- [{status}] {filename} (+{additions}/-{deletions})\n")
 
-            if len(files) > 20:
-                result += f"- ... and {len(files) - 20} more files\n"
+            if more_files:
+                parts.append("- ... and more files (see URL below)\n")
 
-        result += f"\n**URL:** {data['html_url']}\n"
+        parts.append(f"\n**URL:** {data['html_url']}\n")
 
-        return result
+        return "".join(parts)
 
-    def get_workflow_runs(self, owner: str, repo: str, branch: Optional[str] = None, limit: int = 10) -> str:
+    async def get_workflow_runs(self, owner: str, repo: str, branch: Optional[str] = None, limit: int = 10) -> str:
         """
         Get recent GitHub Actions workflow runs.
 
@@ -189,23 +355,21 @@ class GitHubAPI:
             Formatted workflow runs or error message
         """
         endpoint = f"/repos/{owner}/{repo}/actions/runs"
-        params = {'per_page': limit}
+        params = {}
 
         if branch:
             params['branch'] = branch
 
-        data, error = self._make_request(endpoint, params)
+        runs, error = await self._paginate(endpoint, params, limit, items_key='workflow_runs')
 
         if error:
             return error
 
-        runs = data.get('workflow_runs', [])
-
         if not runs:
             return f"No workflow runs found in {owner}/{repo}"
 
-        result = f"# GitHub Actions Workflow Runs: {owner}/{repo}\n\n"
-        result += f"Showing {len(runs)} run(s):\n\n"
+        parts = [f"# GitHub Actions Workflow Runs: {owner}/{repo}\n\n"]
+        parts.append(f"Showing {len(runs)} run(s):\n\n")
 
         for run in runs:
             run_id = run['id']
@@ -225,19 +389,19 @@ class GitHubAPI:
                 'queued': '⏳',
             }.get(status, '❓')
 
-            result += f"## {status_emoji} {workflow_name} (Run #{run_id})\n"
-            result += f"- **Status:** {status}\n"
+            parts.append(f"## {status_emoji} {workflow_name} (Run #{run_id})\n")
+            parts.append(f"- **Status:** {status}\n")
             if conclusion != 'N/A':
-                result += f"- **Conclusion:** {conclusion}\n"
-            result += f"- **Branch:** {branch}\n"
-            result += f"- **Commit:** {commit_sha}\n"
-            result += f"- **Created:** {created_at}\n"
-            result += f"- **Updated:** {updated_at}\n"
-            result += f"- **URL:** {url}\n\n"
+                parts.append(f"- **Conclusion:** {conclusion}\n")
+            parts.append(f"- **Branch:** {branch}\n")
+            parts.append(f"- **Commit:** {commit_sha}\n")
+            parts.append(f"- **Created:** {created_at}\n")
+            parts.append(f"- **Updated:** {updated_at}\n")
+            parts.append(f"- **URL:** {url}\n\n")
 
-        return result
+        return "".join(parts)
 
-    def get_failed_workflows(self, owner: str, repo: str, limit: int = 5) -> str:
+    async def get_failed_workflows(self, owner: str, repo: str, limit: int = 5) -> str:
         """
         Get recent failed workflow runs.
 
@@ -250,26 +414,28 @@ class GitHubAPI:
             Formatted failed workflow runs or error message
         """
         endpoint = f"/repos/{owner}/{repo}/actions/runs"
-        params = {
-            'status': 'completed',
-            'per_page': 50,  # Fetch more to filter for failures
-        }
-
-        data, error = self._make_request(endpoint, params)
 
-        if error:
-            return error
+        # Filter server-side: the status parameter accepts one conclusion at a
+        # time, so query each failure conclusion concurrently and merge
+        responses = await asyncio.gather(*(
+            self._paginate(endpoint, {'status': conclusion}, limit, items_key='workflow_runs')
+            for conclusion in FAILED_CONCLUSIONS
+        ))
 
-        runs = data.get('workflow_runs', [])
+        runs = []
+        for conclusion_runs, error in responses:
+            if error:
+                return error
+            runs.extend(conclusion_runs)
 
-        # Filter for failures
-        failed_runs = [r for r in runs if r.get('conclusion') in ('failure', 'timed_out', 'cancelled')][:limit]
+        # Most recent first across all conclusions
+        failed_runs = sorted(runs, key=lambda r: r['created_at'], reverse=True)[:int(limit)]
 
         if not failed_runs:
             return f"No failed workflow runs found in {owner}/{repo} (recent runs all successful!)"
 
-        result = f"# Failed GitHub Actions Workflows: {owner}/{repo}\n\n"
-        result += f"Showing {len(failed_runs)} failed run(s):\n\n"
+        parts = [f"# Failed GitHub Actions Workflows: {owner}/{repo}\n\n"]
+        parts.append(f"Showing {len(failed_runs)} failed run(s):\n\n")
 
         for run in failed_runs:
             workflow_name = run['name']
@@ -279,16 +445,16 @@ class GitHubAPI:
             created_at = run['created_at']
             url = run['html_url']
 
-            result += f"## ❌ {workflow_name}\n"
-            result += f"- **Conclusion:** {conclusion}\n"
-            result += f"- **Branch:** {branch}\n"
-            result += f"- **Commit:** {commit_sha}\n"
-            result += f"- **Time:** {created_at}\n"
-            result += f"- **URL:** {url}\n\n"
+            parts.append(f"## ❌ {workflow_name}\n")
+            parts.append(f"- **Conclusion:** {conclusion}\n")
+            parts.append(f"- **Branch:** {branch}\n")
+            parts.append(f"- **Commit:** {commit_sha}\n")
+            parts.append(f"- **Time:** {created_at}\n")
+            parts.append(f"- **URL:** {url}\n\n")
 
-        return result
+        return "".join(parts)
 
-    def check_repository_exists(self, owner: str, repo: str) -> str:
+    async def check_repository_exists(self, owner: str, repo: str) -> str:
         """
         Check if a repository exists and is accessible.
 
@@ -301,25 +467,49 @@ class GitHubAPI:
         """
         endpoint = f"/repos/{owner}/{repo}"
 
-        data, error = self._make_request(endpoint)
+        data, error = await self._make_request(endpoint)
 
         if error:
             return error
 
-        result = f"# Repository: {owner}/{repo}\n\n"
-        result += f"**Full Name:** {data['full_name']}\n"
-        result += f"**Description:** {data.get('description', 'No description')}\n"
-        result += f"**Default Branch:** {data['default_branch']}\n"
-        result += f"**Private:** {data['private']}\n"
-        result += f"**Language:** {data.get('language', 'N/A')}\n"
-        result += f"**Created:** {data['created_at']}\n"
-        result += f"**Updated:** {data['updated_at']}\n"
-        result += f"**URL:** {data['html_url']}\n"
+        parts = [f"# Repository: {owner}/{repo}\n\n"]
+        parts.append(f"**Full Name:** {data['full_name']}\n")
+        parts.append(f"**Description:** {data.get('description', 'No description')}\n")
+        parts.append(f"**Default Branch:** {data['default_branch']}\n")
+        parts.append(f"**Private:** {data['private']}\n")
+        parts.append(f"**Language:** {data.get('language', 'N/A')}\n")
+        parts.append(f"**Created:** {data['created_at']}\n")
+        parts.append(f"**Updated:** {data['updated_at']}\n")
+        parts.append(f"**URL:** {data['html_url']}\n")
+
+        return "".join(parts)
+
+    async def get_rca_bundle(self, owner: str, repo: str, branch: str = "main", limit: int = 10,
+                             since_hours: Optional[int] = None) -> str:
+        """
+        Get recent commits, workflow runs and failed workflows in one call.
+
+        The three requests are independent, so they are issued concurrently.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name (default: main)
+            limit: Maximum number of commits and workflow runs to return
+            since_hours: Only return commits from the last N hours (optional)
 
-        return result
+        Returns:
+            Combined markdown report
+        """
+        commits, runs, failed = await asyncio.gather(
+            self.get_recent_commits(owner, repo, branch, limit, since_hours),
+            self.get_workflow_runs(owner, repo, branch, limit),
+            self.get_failed_workflows(owner, repo),
+        )
+        return "\n".join((commits, runs, failed))
 
 
-def github_tool(action: str, **kwargs) -> str:
+async def github_tool(action: str, **kwargs) -> str:
     """
     Kagent tool function for GitHub API operations.
 
@@ -329,6 +519,8 @@ def github_tool(action: str, **kwargs) -> str:
     - workflow_runs: Get workflow runs (requires: owner, repo; optional: branch, limit)
     - failed_workflows: Get failed workflows (requires: owner, repo; optional: limit)
     - check_repo: Check if repository exists (requires: owner, repo)
+    - rca_bundle: Recent commits, workflow runs and failed workflows fetched concurrently
+      (requires: owner, repo; optional: branch, limit, since_hours)
 
     Environment:
     - GITHUB_TOKEN: GitHub personal access token (optional for public repos, required for private)
@@ -341,17 +533,18 @@ def github_tool(action: str, **kwargs) -> str:
         String result from the action
 
     Examples:
-        github_tool(action="recent_commits", owner="kubernetes", repo="kubernetes", limit=5)
-        github_tool(action="commit_details", owner="myorg", repo="myapp", commit_sha="abc123")
-        github_tool(action="workflow_runs", owner="myorg", repo="myapp", branch="main")
-        github_tool(action="failed_workflows", owner="myorg", repo="myapp")
+        await github_tool(action="recent_commits", owner="kubernetes", repo="kubernetes", limit=5)
+        await github_tool(action="commit_details", owner="myorg", repo="myapp", commit_sha="abc123")
+        await github_tool(action="workflow_runs", owner="myorg", repo="myapp", branch="main")
+        await github_tool(action="failed_workflows", owner="myorg", repo="myapp")
+        await github_tool(action="rca_bundle", owner="myorg", repo="myapp", since_hours=24)
     """
     # Check for GitHub token
     token = os.environ.get('GITHUB_TOKEN')
     if not token:
         logger.warning("GITHUB_TOKEN not set - API rate limits will be restricted")
 
-    api = GitHubAPI(token)
+    api = AsyncGitHubAPI(token)
 
     try:
         if action == "recent_commits":
@@ -364,7 +557,7 @@ def github_tool(action: str, **kwargs) -> str:
             if not owner or not repo:
                 return "ERROR: 'owner' and 'repo' parameters required for recent_commits action"
 
-            return api.get_recent_commits(owner, repo, branch, limit, since_hours)
+            return await api.get_recent_commits(owner, repo, branch, limit, since_hours)
 
         elif action == "commit_details":
             owner = kwargs.get("owner")
@@ -374,7 +567,7 @@ def github_tool(action: str, **kwargs) -> str:
             if not owner or not repo or not commit_sha:
                 return "ERROR: 'owner', 'repo', and 'commit_sha' parameters required for commit_details action"
 
-            return api.get_commit_details(owner, repo, commit_sha)
+            return await api.get_commit_details(owner, repo, commit_sha)
 
         elif action == "workflow_runs":
             owner = kwargs.get("owner")
@@ -385,7 +578,7 @@ def github_tool(action: str, **kwargs) -> str:
             if not owner or not repo:
                 return "ERROR: 'owner' and 'repo' parameters required for workflow_runs action"
 
-            return api.get_workflow_runs(owner, repo, branch, limit)
+            return await api.get_workflow_runs(owner, repo, branch, limit)
 
         elif action == "failed_workflows":
             owner = kwargs.get("owner")
@@ -395,7 +588,7 @@ def github_tool(action: str, **kwargs) -> str:
             if not owner or not repo:
                 return "ERROR: 'owner' and 'repo' parameters required for failed_workflows action"
 
-            return api.get_failed_workflows(owner, repo, limit)
+            return await api.get_failed_workflows(owner, repo, limit)
 
         elif action == "check_repo":
             owner = kwargs.get("owner")
@@ -404,18 +597,30 @@ def github_tool(action: str, **kwargs) -> str:
             if not owner or not repo:
                 return "ERROR: 'owner' and 'repo' parameters required for check_repo action"
 
-            return api.check_repository_exists(owner, repo)
+            return await api.check_repository_exists(owner, repo)
+
+        elif action == "rca_bundle":
+            owner = kwargs.get("owner")
+            repo = kwargs.get("repo")
+            branch = kwargs.get("branch", "main")
+            limit = kwargs.get("limit", 10)
+            since_hours = kwargs.get("since_hours")
+
+            if not owner or not repo:
+                return "ERROR: 'owner' and 'repo' parameters required for rca_bundle action"
+
+            return await api.get_rca_bundle(owner, repo, branch, limit, since_hours)
 
         else:
-            return f"ERROR: Unknown action '{action}'. Valid actions: recent_commits, commit_details, workflow_runs, failed_workflows, check_repo"
+            return f"ERROR: Unknown action '{action}'. Valid actions: recent_commits, commit_details, workflow_runs, failed_workflows, check_repo, rca_bundle"
 
     except Exception as e:
         logger.exception("GitHub tool error")
         return f"ERROR: GitHub tool failed: {e}"
 
 
-if __name__ == "__main__":
-    # Test the tool locally
+async def _main():
+    """Test the tool locally."""
     print("Testing GitHub API Tool")
     print("=" * 60)
 
@@ -424,23 +629,29 @@ if __name__ == "__main__":
     if not token:
         print("\nWARNING: GITHUB_TOKEN not set. Testing with public repository (rate limits apply).\n")
 
-    api = GitHubAPI(token)
+    api = AsyncGitHubAPI(token)
 
     # Test with a public repository (kubernetes/kubernetes)
     print("\n1. Checking if kubernetes/kubernetes repository exists...")
-    print(api.check_repository_exists("kubernetes", "kubernetes"))
+    print(await api.check_repository_exists("kubernetes", "kubernetes"))
 
     print("\n2. Getting recent commits from kubernetes/kubernetes...")
-    print(api.get_recent_commits("kubernetes", "kubernetes", "master", limit=3))
+    print(await api.get_recent_commits("kubernetes", "kubernetes", "master", limit=3))
 
     print("\n" + "=" * 60)
     print("Testing github_tool function interface")
     print("=" * 60)
 
     print("\nTest: github_tool(action='recent_commits', ...)")
-    print(github_tool(action="recent_commits", owner="kubernetes", repo="kubernetes", branch="master", limit=2))
+    print(await github_tool(action="recent_commits", owner="kubernetes", repo="kubernetes", branch="master", limit=2))
 
     if token:
         print("\n\nNote: Full testing requires a valid GITHUB_TOKEN environment variable.")
     else:
         print("\n\nNote: Set GITHUB_TOKEN environment variable to test with private repositories.")
+
+    await _get_client().aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
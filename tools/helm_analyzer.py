@@ -5,89 +5,491 @@ Provides analysis of Helm releases, configurations, and deployment history.
 Uses kubectl and helm CLI commands to gather information about Helm-managed applications.
 """
 
+import asyncio
+import difflib
+import hashlib
+import inspect
+import os
+import selectors
+import shutil
 import subprocess
 import json
+import time
 import yaml
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Callable, List, Dict, Optional, Union
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader/dumper; the pure-Python ones are much slower
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
+# Try to import orjson, but make it optional (its JSONDecodeError subclasses
+# json.JSONDecodeError, so error handling is the same either way)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Successful command outputs are reused for this long, so repeated queries in
+# one RCA session do not fork a new helm/kubectl process each time
+COMMAND_CACHE_TTL = 15  # seconds
+# Entry cap; manifests can be large, so old entries are evicted LRU-first
+COMMAND_CACHE_MAX_SIZE = 64
+
+# Seconds a single helm/kubectl invocation may run before it is killed
+COMMAND_TIMEOUT = 30
+
+# Field extractors for `helm list` and `helm history` JSON entries; helm always
+# emits these keys (none are omitempty)
+RELEASE_FIELDS = itemgetter('name', 'namespace', 'chart', 'app_version', 'status', 'updated', 'revision')
+HISTORY_FIELDS = itemgetter('revision', 'updated', 'status', 'chart', 'app_version', 'description')
+
+# Skip the close-all-descriptors pass when forking helm/kubectl. Python opens
+# files and sockets non-inheritable (PEP 446), so the child still receives only
+# its stdio pipes unless something explicitly marks a descriptor inheritable.
+CLOSE_FDS = False
+
+# Manifests longer than this are truncated; the rest is never read from helm
+MANIFEST_MAX_LENGTH = 5000
+MANIFEST_READ_CHUNK = 4096
+
+# Longest values diff returned by compare_revisions
+COMPARE_DIFF_MAX_LINES = 200
+
+# Values of a numbered revision never change, so they are kept on disk across
+# processes, keyed by cluster, release, namespace and revision. Set to an
+# empty string to disable.
+REVISION_CACHE_DIR = os.environ.get(
+    'HELM_ANALYZER_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'helm_analyzer')
+)
+
+
+# Pods, containers and fields in the pod health listing are delimited with the
+# ASCII group/record/unit separators, which never occur in names and status text
+_POD_SEP, _CONTAINER_SEP, _FIELD_SEP = "\x1d", "\x1e", "\x1f"
+
+# kubectl jsonpath that projects only the pod fields the health check reports,
+# instead of transferring and parsing the full pod objects
+POD_HEALTH_JSONPATH = (
+    "{range .items[*]}"
+    "{.metadata.name}" + _FIELD_SEP + "{.status.phase}"
+    "{range .status.containerStatuses[*]}" + _CONTAINER_SEP +
+    "{.name}" + _FIELD_SEP + "{.ready}" + _FIELD_SEP + "{.restartCount}" + _FIELD_SEP +
+    "{.state.waiting.reason}" + _FIELD_SEP + "{.state.waiting.message}"
+    "{end}" + _POD_SEP +
+    "{end}"
+)
+
+
+def _parse_pod_listing(listing: str) -> Dict[str, List]:
+    """
+    Parse the POD_HEALTH_JSONPATH listing into parallel per-field columns.
+
+    Args:
+        listing: kubectl output for POD_HEALTH_JSONPATH
+
+    Returns:
+        Dict of equal-length lists: name, phase and containers (each a list of
+        dicts with name, ready, restarts and waiting state or None)
+    """
+    names: List[str] = []
+    phases: List[str] = []
+    containers: List[List[Dict[str, Any]]] = []
+
+    for record in listing.split(_POD_SEP):
+        if not record.strip():
+            continue
+        head, *container_records = record.split(_CONTAINER_SEP)
+        name, _, phase = head.partition(_FIELD_SEP)
+
+        pod_containers = []
+        for container in container_records:
+            container_name, ready, restarts, reason, message = container.split(_FIELD_SEP, 4)
+            pod_containers.append({
+                'name': container_name,
+                'ready': ready == "true",
+                'restarts': int(restarts or 0),
+                'waiting': {'reason': reason or 'Unknown', 'message': message} if reason or message else None,
+            })
+
+        names.append(name)
+        phases.append(phase or 'Unknown')
+        containers.append(pod_containers)
+
+    return {'name': names, 'phase': phases, 'containers': containers}
+
 
 class HelmAnalyzer:
     """Analyzes Helm releases and their configurations."""
 
-    def __init__(self):
-        """Initialize Helm analyzer."""
-        pass
+    JSON_OUTPUT = ("--output", "json")
+
+    def __init__(self, ttl: float = COMMAND_CACHE_TTL, cache_dir: Optional[str] = REVISION_CACHE_DIR):
+        """
+        Initialize Helm analyzer.
 
-    def _run_command(self, cmd: List[str]) -> tuple[str, str, int]:
+        Args:
+            ttl: Seconds a successful command output is served from cache (0 disables caching)
+            cache_dir: Directory for the on-disk revision values cache (None or "" disables it)
+        """
+        self.ttl = ttl
+        self.cache_dir = cache_dir or None
+        # API server URL of the current kube context; None until looked up,
+        # "" if it could not be determined (disk cache is then skipped)
+        self._cluster_server: Optional[str] = None
+        # Resolve binaries once instead of searching $PATH on every exec
+        self.helm = shutil.which("helm") or "helm"
+        self.kubectl = shutil.which("kubectl") or "kubectl"
+        self._cache: "OrderedDict[tuple, tuple[float, tuple[bytes, str, int]]]" = OrderedDict()
+
+    def _cache_get(self, key: tuple) -> Optional[tuple[bytes, str, int]]:
+        """Return a fresh cached command result, or None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: tuple, result: tuple[bytes, str, int]) -> None:
+        """Cache a command result if it succeeded, evicting the least recently used entry."""
+        if self.ttl <= 0 or result[2] != 0:
+            return
+        self._cache[key] = (time.monotonic(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > COMMAND_CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached command outputs (e.g. after a helm upgrade or rollback)."""
+        self._cache.clear()
+
+    def _run_command(self, cmd: List[str]) -> tuple[bytes, str, int]:
         """
         Run a shell command and return output.
 
+        Successful results are cached for `ttl` seconds, keyed by the full command.
+        stdout is left as bytes: the JSON and YAML parsers take bytes directly,
+        and only text embedded in a response is decoded.
+
         Args:
             cmd: Command as list of strings
 
         Returns:
-            Tuple of (stdout, stderr, return_code)
+            Tuple of (stdout bytes, decoded stderr, return_code)
         """
+        key = tuple(cmd)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return result.stdout, result.stderr, result.returncode
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=CLOSE_FDS)
+        except Exception as e:
+            return b"", str(e), 1
+
+        try:
+            stdout, stderr = proc.communicate(timeout=COMMAND_TIMEOUT)
         except subprocess.TimeoutExpired:
-            return "", "Command timed out", 1
+            proc.kill()
+            proc.communicate()
+            return b"", "Command timed out", 1
+
+        output = stdout, stderr.decode(errors='replace'), proc.returncode
+        self._cache_put(key, output)
+        return output
+
+    async def _run_command_async(self, cmd: List[str]) -> tuple[bytes, str, int]:
+        """
+        Run a command without blocking the event loop and return output.
+
+        Lets independent helm/kubectl calls run concurrently with asyncio.gather.
+        Shares the result cache with _run_command.
+
+        Args:
+            cmd: Command as list of strings
+
+        Returns:
+            Tuple of (stdout bytes, decoded stderr, return_code)
+        """
+        key = tuple(cmd)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=CLOSE_FDS
+            )
         except Exception as e:
-            return "", str(e), 1
+            return b"", str(e), 1
 
-    def list_releases(self, namespace: Optional[str] = None, all_namespaces: bool = False) -> str:
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=COMMAND_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return b"", "Command timed out", 1
+
+        output = stdout, stderr.decode(errors='replace'), proc.returncode
+        self._cache_put(key, output)
+        return output
+
+    async def _get_pods_async(self, cmd: List[str]) -> tuple[Optional[Dict[str, List]], str, int]:
         """
-        List Helm releases.
+        Run a `kubectl get pods -o jsonpath=POD_HEALTH_JSONPATH` command and parse the pods.
+
+        Args:
+            cmd: Command as list of strings
+
+        Returns:
+            Tuple of (pod columns or None, stderr, return_code)
+        """
+        stdout, stderr, code = await self._run_command_async(cmd)
+        if code != 0:
+            return None, stderr, code
+
+        try:
+            pods = _parse_pod_listing(stdout.decode())
+        except ValueError as e:
+            return None, f"Unexpected pod listing format: {e}", 1
+
+        return pods, stderr, code
+
+    def _build_list_cmd(self, namespace: Optional[str] = None, all_namespaces: bool = False) -> List[str]:
+        """
+        Build the `helm list` command shared by the sync and async list paths.
 
         Args:
             namespace: Specific namespace to query (optional)
             all_namespaces: List releases from all namespaces
 
         Returns:
-            Formatted list of releases or error message
+            Command argv
         """
-        cmd = ["helm", "list", "--output", "json"]
+        cmd = [self.helm, "list", *self.JSON_OUTPUT]
 
         if all_namespaces:
             cmd.append("--all-namespaces")
         elif namespace:
             cmd.extend(["--namespace", namespace])
 
-        stdout, stderr, code = self._run_command(cmd)
+        return cmd
 
+    @staticmethod
+    def _parse_list_output(stdout: bytes, stderr: str, code: int) -> tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        Parse the result of a `helm list` command.
+
+        Args:
+            stdout: Command JSON output
+            stderr: Command error output
+            code: Command exit code
+
+        Returns:
+            Tuple of (releases, error message)
+        """
         if code != 0:
-            return f"ERROR: Failed to list Helm releases: {stderr}"
+            return None, f"ERROR: Failed to list Helm releases: {stderr}"
 
         try:
-            releases = json.loads(stdout) if stdout else []
+            return (_json_loads(stdout) if stdout else []) or [], None
+        except json.JSONDecodeError as e:
+            return None, f"ERROR: Failed to parse Helm output: {e}"
+
+    def _list_releases_parsed(self, namespace: Optional[str] = None,
+                              all_namespaces: bool = False) -> tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        List Helm releases as parsed helm output.
 
-            if not releases:
-                return "No Helm releases found"
+        Args:
+            namespace: Specific namespace to query (optional)
+            all_namespaces: List releases from all namespaces
 
-            # Format output
-            result = f"Found {len(releases)} Helm release(s):\n\n"
-            for r in releases:
-                result += f"- **{r.get('name')}** (namespace: {r.get('namespace')})\n"
-                result += f"  - Chart: {r.get('chart')}\n"
-                result += f"  - App Version: {r.get('app_version')}\n"
-                result += f"  - Status: {r.get('status')}\n"
-                result += f"  - Updated: {r.get('updated')}\n"
-                result += f"  - Revision: {r.get('revision')}\n\n"
+        Returns:
+            Tuple of (releases, error message)
+        """
+        return self._parse_list_output(*self._run_command(self._build_list_cmd(namespace, all_namespaces)))
 
-            return result
+    def list_releases(self, namespace: Optional[str] = None, all_namespaces: bool = False) -> str:
+        """
+        List Helm releases.
+
+        Args:
+            namespace: Specific namespace to query (optional)
+            all_namespaces: List releases from all namespaces
 
+        Returns:
+            Formatted list of releases or error message
+        """
+        releases, error = self._list_releases_parsed(namespace, all_namespaces)
+        if error:
+            return error
+
+        if not releases:
+            return "No Helm releases found"
+
+        # Format output
+        parts = [f"Found {len(releases)} Helm release(s):\n\n"]
+        parts.extend(
+            f"- **{name}** (namespace: {ns})\n"
+            f"  - Chart: {chart}\n"
+            f"  - App Version: {ver}\n"
+            f"  - Status: {status}\n"
+            f"  - Updated: {updated}\n"
+            f"  - Revision: {rev}\n\n"
+            for name, ns, chart, ver, status, updated, rev in map(RELEASE_FIELDS, releases)
+        )
+
+        return "".join(parts)
+
+    async def _list_releases_with_details_parsed(self, namespace: Optional[str] = None, all_namespaces: bool = False,
+                                                 concurrency: int = 10) -> tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        List Helm releases, each with a 'details' dict from `helm status`.
+
+        Lists once, then fetches `helm status` for every release concurrently,
+        with at most `concurrency` helm processes running at a time.
+
+        Args:
+            namespace: Specific namespace to query (optional)
+            all_namespaces: List releases from all namespaces
+            concurrency: Maximum number of concurrent detail lookups
+
+        Returns:
+            Tuple of (releases, error message)
+        """
+        releases, error = self._parse_list_output(
+            *await self._run_command_async(self._build_list_cmd(namespace, all_namespaces))
+        )
+        if error:
+            return None, error
+
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(r: Dict[str, Any]) -> tuple[bytes, str, int]:
+            async with sem:
+                return await self._run_command_async(
+                    [self.helm, "status", r.get('name'), "--namespace", r.get('namespace'), *self.JSON_OUTPUT]
+                )
+
+        statuses = await asyncio.gather(*(fetch(r) for r in releases))
+
+        for r, (status_out, status_err, status_code) in zip(releases, statuses):
+            if status_code != 0:
+                r['details'] = {'error': status_err.strip()}
+                continue
+
+            try:
+                info = _json_loads(status_out).get('info', {})
+            except json.JSONDecodeError:
+                r['details'] = {'error': "unparseable helm status output"}
+                continue
+
+            r['details'] = {
+                'description': info.get('description'),
+                'first_deployed': info.get('first_deployed'),
+                'last_deployed': info.get('last_deployed'),
+            }
+
+        return releases, None
+
+    async def list_releases_with_details(self, namespace: Optional[str] = None, all_namespaces: bool = False,
+                                         concurrency: int = 10) -> str:
+        """
+        List Helm releases together with the status details of each one.
+
+        Args:
+            namespace: Specific namespace to query (optional)
+            all_namespaces: List releases from all namespaces
+            concurrency: Maximum number of concurrent detail lookups
+
+        Returns:
+            Formatted list of releases with details or error message
+        """
+        releases, error = await self._list_releases_with_details_parsed(namespace, all_namespaces, concurrency)
+        if error:
+            return error
+
+        if not releases:
+            return "No Helm releases found"
+
+        parts = [f"Found {len(releases)} Helm release(s):\n\n"]
+        for r in releases:
+            name, ns, chart, ver, status, updated, rev = RELEASE_FIELDS(r)
+            parts.append(
+                f"- **{name}** (namespace: {ns})\n"
+                f"  - Chart: {chart}\n"
+                f"  - App Version: {ver}\n"
+                f"  - Status: {status}\n"
+                f"  - Updated: {updated}\n"
+                f"  - Revision: {rev}\n"
+            )
+
+            details = r['details']
+            if 'error' in details:
+                parts.append(f"  - Details: unavailable ({details['error']})\n\n")
+                continue
+
+            parts.append(
+                f"  - Description: {details['description']}\n"
+                f"  - First Deployed: {details['first_deployed']}\n"
+                f"  - Last Deployed: {details['last_deployed']}\n\n"
+            )
+
+        return "".join(parts)
+
+    def _release_details_parsed(self, release: str, namespace: str) -> tuple[Optional[Dict], Optional[str]]:
+        """
+        Get the status fields of a Helm release.
+
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
+
+        Returns:
+            Tuple of (release details, error message)
+        """
+        cmd = [self.helm, "status", release, "--namespace", namespace, *self.JSON_OUTPUT]
+
+        stdout, stderr, code = self._run_command(cmd)
+
+        if code != 0:
+            return None, f"ERROR: Failed to get release details: {stderr}"
+
+        try:
+            info = _json_loads(stdout).get('info', {})
         except json.JSONDecodeError as e:
-            return f"ERROR: Failed to parse Helm output: {e}"
+            return None, f"ERROR: Failed to parse release details: {e}"
+
+        return {
+            'release': release,
+            'namespace': namespace,
+            'status': info.get('status'),
+            'description': info.get('description'),
+            'first_deployed': info.get('first_deployed'),
+            'last_deployed': info.get('last_deployed'),
+            'notes': info.get('notes', 'No notes'),
+        }, None
 
     def get_release_details(self, release: str, namespace: str) -> str:
         """
@@ -100,28 +502,49 @@ class HelmAnalyzer:
         Returns:
             Formatted release details or error message
         """
-        cmd = ["helm", "status", release, "--namespace", namespace, "--output", "json"]
+        details, error = self._release_details_parsed(release, namespace)
+        if error:
+            return error
+
+        parts = [
+            f"# Helm Release: {release}\n\n",
+            f"**Namespace:** {namespace}\n",
+            f"**Status:** {details['status']}\n",
+            f"**Description:** {details['description']}\n",
+            f"**First Deployed:** {details['first_deployed']}\n",
+            f"**Last Deployed:** {details['last_deployed']}\n",
+            f"**Notes:**\n```\n{details['notes']}\n```\n",
+        ]
+
+        return "".join(parts)
+
+    def _values_parsed(self, release: str, namespace: str,
+                       all_values: bool = False) -> tuple[Optional[Dict], Optional[str]]:
+        """
+        Get Helm release values as a dict.
 
-        stdout, stderr, code = self._run_command(cmd)
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
+            all_values: Get all values including defaults (False = only user-provided values)
 
-        if code != 0:
-            return f"ERROR: Failed to get release details: {stderr}"
+        Returns:
+            Tuple of (values, error message); values is {} when none are set
+        """
+        cmd = [self.helm, "get", "values", release, "--namespace", namespace, *self.JSON_OUTPUT]
 
-        try:
-            data = json.loads(stdout)
+        if all_values:
+            cmd.append("--all")
 
-            result = f"# Helm Release: {release}\n\n"
-            result += f"**Namespace:** {namespace}\n"
-            result += f"**Status:** {data.get('info', {}).get('status')}\n"
-            result += f"**Description:** {data.get('info', {}).get('description')}\n"
-            result += f"**First Deployed:** {data.get('info', {}).get('first_deployed')}\n"
-            result += f"**Last Deployed:** {data.get('info', {}).get('last_deployed')}\n"
-            result += f"**Notes:**\n```\n{data.get('info', {}).get('notes', 'No notes')}\n```\n"
+        stdout, stderr, code = self._run_command(cmd)
 
-            return result
+        if code != 0:
+            return None, f"ERROR: Failed to get release values: {stderr}"
 
+        try:
+            return (_json_loads(stdout) if stdout else None) or {}, None
         except json.JSONDecodeError as e:
-            return f"ERROR: Failed to parse release details: {e}"
+            return None, f"ERROR: Failed to parse release values: {e}"
 
     def get_values(self, release: str, namespace: str, all_values: bool = False) -> str:
         """
@@ -135,7 +558,7 @@ class HelmAnalyzer:
         Returns:
             YAML-formatted values or error message
         """
-        cmd = ["helm", "get", "values", release, "--namespace", namespace]
+        cmd = [self.helm, "get", "values", release, "--namespace", namespace]
 
         if all_values:
             cmd.append("--all")
@@ -145,10 +568,10 @@ class HelmAnalyzer:
         if code != 0:
             return f"ERROR: Failed to get release values: {stderr}"
 
-        if not stdout or stdout.strip() == "null":
+        if not stdout or stdout.strip() == b"null":
             return f"No custom values set for release '{release}' (using chart defaults)"
 
-        return f"# Values for {release}\n\n```yaml\n{stdout}\n```"
+        return f"# Values for {release}\n\n```yaml\n{stdout.decode()}\n```"
 
     def get_manifest(self, release: str, namespace: str) -> str:
         """
@@ -161,19 +584,97 @@ class HelmAnalyzer:
         Returns:
             Kubernetes manifests or error message
         """
-        cmd = ["helm", "get", "manifest", release, "--namespace", namespace]
+        cmd = [self.helm, "get", "manifest", release, "--namespace", namespace]
+        max_length = MANIFEST_MAX_LENGTH
+
+        # Read only as much of the manifest as will be shown, then stop helm;
+        # rendered manifests of large releases can run to megabytes. Unbuffered
+        # stdout lets the reads be timed out with a selector.
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    bufsize=0, close_fds=CLOSE_FDS)
+        except Exception as e:
+            return f"ERROR: Failed to get release manifest: {e}"
+
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        timed_out = False
+        try:
+            # One byte past the limit is enough to know the manifest is truncated
+            chunks = []
+            remaining = max_length + 1
+            with selectors.DefaultSelector() as sel:
+                sel.register(proc.stdout, selectors.EVENT_READ)
+                while remaining > 0:
+                    wait = deadline - time.monotonic()
+                    if wait <= 0 or not sel.select(wait):
+                        timed_out = True
+                        break
+                    chunk = proc.stdout.read(min(MANIFEST_READ_CHUNK, remaining))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    remaining -= len(chunk)
+
+            truncated = remaining <= 0
+            stderr = b""
+            if truncated or timed_out:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+            else:
+                try:
+                    _, stderr = proc.communicate(timeout=max(deadline - time.monotonic(), 0))
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    timed_out = True
+        finally:
+            proc.stdout.close()
+            proc.stderr.close()
+
+        if timed_out:
+            return "ERROR: Failed to get release manifest: Command timed out"
+
+        if not truncated and proc.returncode != 0:
+            return f"ERROR: Failed to get release manifest: {stderr.decode(errors='replace')}"
+
+        stdout = b"".join(chunks)
+        if truncated:
+            return f"# Manifest for {release} (truncated)\n\n```yaml\n{stdout[:max_length].decode(errors='ignore')}\n...\n[Truncated - manifest too large]\n```"
+
+        return f"# Manifest for {release}\n\n```yaml\n{stdout.decode()}\n```"
+
+    def _history_parsed(self, release: str, namespace: str,
+                        limit: int = 10) -> tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        Get deployment history for a Helm release, newest revision first.
+
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
+            limit: Maximum number of revisions to return
+
+        Returns:
+            Tuple of (revisions, error message)
+        """
+        cmd = [self.helm, "history", release, "--namespace", namespace, *self.JSON_OUTPUT, "--max", str(limit)]
 
         stdout, stderr, code = self._run_command(cmd)
 
         if code != 0:
-            return f"ERROR: Failed to get release manifest: {stderr}"
+            return None, f"ERROR: Failed to get release history: {stderr}"
 
-        # Truncate if too large
-        max_length = 5000
-        if len(stdout) > max_length:
-            return f"# Manifest for {release} (truncated)\n\n```yaml\n{stdout[:max_length]}\n...\n[Truncated - manifest too large]\n```"
+        try:
+            history = _json_loads(stdout) or []
+        except json.JSONDecodeError as e:
+            return None, f"ERROR: Failed to parse release history: {e}"
 
-        return f"# Manifest for {release}\n\n```yaml\n{stdout}\n```"
+        # helm lists revisions oldest first; flip the freshly parsed list in place
+        history.reverse()
+        return history, None
 
     def get_history(self, release: str, namespace: str, limit: int = 10) -> str:
         """
@@ -187,36 +688,140 @@ class HelmAnalyzer:
         Returns:
             Formatted release history or error message
         """
-        cmd = ["helm", "history", release, "--namespace", namespace, "--output", "json", "--max", str(limit)]
+        history, error = self._history_parsed(release, namespace, limit)
+        if error:
+            return error
+
+        if not history:
+            return f"No history found for release '{release}'"
+
+        parts = [
+            f"# Release History: {release}\n\n",
+            f"Showing last {min(len(history), limit)} revision(s):\n\n"
+        ]
+        parts.extend(
+            f"## Revision {rev}\n"
+            f"- **Updated:** {updated}\n"
+            f"- **Status:** {status}\n"
+            f"- **Chart:** {chart}\n"
+            f"- **App Version:** {ver}\n"
+            f"- **Description:** {description}\n\n"
+            for rev, updated, status, chart, ver, description in map(HISTORY_FIELDS, history)
+        )
+
+        return "".join(parts)
+
+    async def _get_cluster_server(self) -> str:
+        """
+        Return the API server URL of the current kube context ("" if unknown).
 
-        stdout, stderr, code = self._run_command(cmd)
+        Identifies the cluster in disk cache keys; looked up once per analyzer.
+        """
+        if self._cluster_server is None:
+            stdout, _, code = await self._run_command_async(
+                [self.kubectl, "config", "view", "--minify", "-o", "jsonpath={.clusters[0].cluster.server}"]
+            )
+            self._cluster_server = stdout.decode().strip() if code == 0 else ""
+        return self._cluster_server
+
+    async def _revision_cache_path(self, release: str, namespace: str, revision: int) -> Optional[str]:
+        """Return the disk cache file for a revision's values, or None if disk caching is off."""
+        if not self.cache_dir:
+            return None
+        server = await self._get_cluster_server()
+        if not server:
+            return None
+        key = hashlib.sha1(f"{server}\0{release}\0{namespace}\0{revision}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    async def _get_revision_values(self, release: str, namespace: str, revision: int) -> tuple[Optional[Any], str]:
+        """
+        Get the user-supplied values of one release revision, via the disk cache.
 
-        if code != 0:
-            return f"ERROR: Failed to get release history: {stderr}"
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
+            revision: Revision number
+
+        Returns:
+            Tuple of (values, error message); values is None on failure
+        """
+        path = await self._revision_cache_path(release, namespace, revision)
+
+        # Disk I/O runs on a worker thread so it doesn't stall the other fetches on the loop
+        if path:
+            values = await asyncio.to_thread(self._read_revision_cache, path)
+            if values is not None:
+                return values, ""
+
+        values, error = await self._fetch_revision_values(release, namespace, revision)
 
+        if path and values is not None:
+            await asyncio.to_thread(self._write_revision_cache, path, values)
+
+        return values, error
+
+    @staticmethod
+    def _read_revision_cache(path: str) -> Optional[Any]:
+        """Return the values cached at path, or None if there is no usable entry."""
         try:
-            history = json.loads(stdout)
+            with open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable revision cache entry %s: %s", path, e)
+        return None
+
+    def _write_revision_cache(self, path: str, values: Any) -> None:
+        """Cache a revision's values at path, logging (not raising) on failure."""
+        # Write to a temp file and rename, so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(_json_dumps(values))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            logger.debug("Could not write revision cache entry %s: %s", path, e)
+
+    async def _fetch_revision_values(self, release: str, namespace: str, revision: int) -> tuple[Optional[Any], str]:
+        """
+        Fetch the user-supplied values of one release revision as Python data.
 
-            if not history:
-                return f"No history found for release '{release}'"
+        Asks helm for JSON, which spares helm its own YAML serialization and
+        parses faster here; helm versions without `--output` on `get values`
+        fall back to YAML.
+
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
+            revision: Revision number
 
-            result = f"# Release History: {release}\n\n"
-            result += f"Showing last {min(len(history), limit)} revision(s):\n\n"
+        Returns:
+            Tuple of (values, error message); values is None on failure
+        """
+        cmd = [self.helm, "get", "values", release, "--namespace", namespace, "--revision", str(revision)]
 
-            for h in reversed(history):  # Show newest first
-                result += f"## Revision {h.get('revision')}\n"
-                result += f"- **Updated:** {h.get('updated')}\n"
-                result += f"- **Status:** {h.get('status')}\n"
-                result += f"- **Chart:** {h.get('chart')}\n"
-                result += f"- **App Version:** {h.get('app_version')}\n"
-                result += f"- **Description:** {h.get('description')}\n\n"
+        stdout, stderr, code = await self._run_command_async([*cmd, *self.JSON_OUTPUT])
+        if code == 0:
+            try:
+                return _json_loads(stdout) or {}, ""
+            except json.JSONDecodeError as e:
+                return None, str(e)
 
-            return result
+        if "unknown flag" not in stderr:
+            return None, stderr
 
-        except json.JSONDecodeError as e:
-            return f"ERROR: Failed to parse release history: {e}"
+        stdout, stderr, code = await self._run_command_async(cmd)
+        if code != 0:
+            return None, stderr
+        try:
+            return yaml.load(stdout, Loader=_YLoader) or {}, ""
+        except yaml.YAMLError as e:
+            return None, str(e)
 
-    def compare_revisions(self, release: str, namespace: str, revision1: int, revision2: int) -> str:
+    async def compare_revisions(self, release: str, namespace: str, revision1: int, revision2: int) -> str:
         """
         Compare two revisions of a Helm release.
 
@@ -227,97 +832,211 @@ class HelmAnalyzer:
             revision2: Second revision number
 
         Returns:
-            Comparison of values between revisions
+            Unified diff of the values between revisions
         """
-        # Get values for both revisions
-        cmd1 = ["helm", "get", "values", release, "--namespace", namespace, "--revision", str(revision1)]
-        cmd2 = ["helm", "get", "values", release, "--namespace", namespace, "--revision", str(revision2)]
+        # Look up the cluster identity for the disk cache before fanning out,
+        # so the two concurrent fetches do not both run kubectl for it
+        if self.cache_dir:
+            await self._get_cluster_server()
+
+        # Get values for both revisions (once if they are the same revision)
+        if revision1 == revision2:
+            values1, error1 = await self._get_revision_values(release, namespace, revision1)
+            values2, error2 = values1, error1
+        else:
+            (values1, error1), (values2, error2) = await asyncio.gather(
+                self._get_revision_values(release, namespace, revision1),
+                self._get_revision_values(release, namespace, revision2)
+            )
 
-        stdout1, stderr1, code1 = self._run_command(cmd1)
-        stdout2, stderr2, code2 = self._run_command(cmd2)
+        if values1 is None or values2 is None:
+            return f"ERROR: Failed to get revision values: {error1 or error2}"
 
-        if code1 != 0 or code2 != 0:
-            return f"ERROR: Failed to get revision values: {stderr1 or stderr2}"
+        # Diff the normalized (key-sorted) documents so that formatting and key
+        # order differences in helm's output do not show up as changes
+        diff = list(difflib.unified_diff(
+            yaml.dump(values1, Dumper=_YDumper).splitlines(),
+            yaml.dump(values2, Dumper=_YDumper).splitlines(),
+            fromfile=f"revision {revision1}",
+            tofile=f"revision {revision2}",
+            lineterm=''
+        ))
 
         result = f"# Revision Comparison: {release}\n\n"
-        result += f"## Revision {revision1} Values\n```yaml\n{stdout1 or 'null'}\n```\n\n"
-        result += f"## Revision {revision2} Values\n```yaml\n{stdout2 or 'null'}\n```\n\n"
-        result += "**Note:** Use diff tools to identify specific changes between these values.\n"
+
+        if not diff:
+            result += f"No differences in values between revision {revision1} and revision {revision2}.\n"
+            return result
+
+        if len(diff) > COMPARE_DIFF_MAX_LINES:
+            omitted = len(diff) - COMPARE_DIFF_MAX_LINES
+            diff = diff[:COMPARE_DIFF_MAX_LINES] + [f"... [{omitted} more diff lines truncated]"]
+
+        diff_text = "\n".join(diff)
+        result += f"## Values Diff (revision {revision1} -> {revision2})\n```diff\n{diff_text}\n```\n"
 
         return result
 
-    def check_release_health(self, release: str, namespace: str) -> str:
+    async def _check_release_health_parsed(self, release: str,
+                                           namespace: str) -> tuple[Optional[Dict], Optional[str]]:
         """
-        Check health of a Helm release by examining its resources.
+        Get the Helm status of a release and a summary of its pods.
 
         Args:
             release: Release name
             namespace: Namespace where release is deployed
 
         Returns:
-            Health status of release resources
+            Tuple of (health dict, error message); 'pods' holds parallel name/phase/containers
+            lists, or None if pods could not be listed
         """
-        # Get release status first
-        cmd = ["helm", "status", release, "--namespace", namespace, "--output", "json"]
-        stdout, stderr, code = self._run_command(cmd)
+        # Release status and its pods are independent lookups; fetch both at once
+        cmd = [self.helm, "status", release, "--namespace", namespace, *self.JSON_OUTPUT]
+        cmd_pods = [self.kubectl, "get", "pods", "-n", namespace,
+                    "-l", f"app.kubernetes.io/instance={release}",
+                    "--output", f"jsonpath={POD_HEALTH_JSONPATH}"]
+
+        (stdout, stderr, code), (pods, pods_err, pods_code) = await asyncio.gather(
+            self._run_command_async(cmd),
+            self._get_pods_async(cmd_pods)
+        )
 
         if code != 0:
-            return f"ERROR: Failed to check release health: {stderr}"
+            return None, f"ERROR: Failed to check release health: {stderr}"
 
         try:
-            data = json.loads(stdout)
-            status = data.get('info', {}).get('status')
+            status = _json_loads(stdout).get('info', {}).get('status')
+        except json.JSONDecodeError as e:
+            return None, f"ERROR: Failed to parse health check data: {e}"
+
+        return {
+            'release': release,
+            'namespace': namespace,
+            'status': status,
+            'pods': pods if pods_code == 0 else None,
+        }, None
 
-            result = f"# Health Check: {release}\n\n"
-            result += f"**Helm Status:** {status}\n\n"
+    async def check_release_health(self, release: str, namespace: str) -> str:
+        """
+        Check health of a Helm release by examining its resources.
 
-            if status != "deployed":
-                result += f"**WARNING:** Release is not in 'deployed' state. Current state: {status}\n\n"
+        Args:
+            release: Release name
+            namespace: Namespace where release is deployed
 
-            # Get pods managed by this release
-            cmd_pods = ["kubectl", "get", "pods", "-n", namespace,
-                        "-l", f"app.kubernetes.io/instance={release}",
-                        "--output", "json"]
+        Returns:
+            Health status of release resources
+        """
+        health, error = await self._check_release_health_parsed(release, namespace)
+        if error:
+            return error
 
-            pods_out, pods_err, pods_code = self._run_command(cmd_pods)
+        status = health['status']
+        pods = health['pods']
 
-            if pods_code == 0 and pods_out:
-                pods_data = json.loads(pods_out)
-                pods = pods_data.get('items', [])
+        parts = [f"# Health Check: {release}\n\n", f"**Helm Status:** {status}\n\n"]
 
-                result += f"## Pod Health ({len(pods)} pod(s))\n\n"
+        if status != "deployed":
+            parts.append(f"**WARNING:** Release is not in 'deployed' state. Current state: {status}\n\n")
 
-                for pod in pods:
-                    pod_name = pod['metadata']['name']
-                    phase = pod['status'].get('phase', 'Unknown')
-                    result += f"- **{pod_name}:** {phase}\n"
+        # Pods managed by this release
+        if pods is not None:
+            parts.append(f"## Pod Health ({len(pods['name'])} pod(s))\n\n")
 
-                    # Check container statuses
-                    container_statuses = pod['status'].get('containerStatuses', [])
-                    for cs in container_statuses:
-                        container_name = cs['name']
-                        ready = cs['ready']
-                        restart_count = cs['restartCount']
+            for pod_name, phase, container_statuses in zip(pods['name'], pods['phase'], pods['containers']):
+                parts.append(f"- **{pod_name}:** {phase}\n")
 
-                        result += f"  - Container `{container_name}`: Ready={ready}, Restarts={restart_count}\n"
+                # Check container statuses
+                for cs in container_statuses:
+                    ready = cs['ready']
+                    restart_count = cs['restarts']
+                    parts.append(f"  - Container `{cs['name']}`: Ready={ready}, Restarts={restart_count}\n")
 
-                        # Check for issues
-                        if not ready or restart_count > 0:
-                            state = cs.get('state', {})
-                            if 'waiting' in state:
-                                reason = state['waiting'].get('reason', 'Unknown')
-                                message = state['waiting'].get('message', '')
-                                result += f"    - **Issue:** {reason} - {message}\n"
+                    # Check for issues
+                    waiting = cs['waiting']
+                    if (not ready or restart_count > 0) and waiting is not None:
+                        reason = waiting.get('reason', 'Unknown')
+                        message = waiting.get('message', '')
+                        parts.append(f"    - **Issue:** {reason} - {message}\n")
 
-                result += "\n"
+            parts.append("\n")
 
-            else:
-                result += f"**Note:** Could not retrieve pod information (release may not manage pods)\n\n"
+        else:
+            parts.append("**Note:** Could not retrieve pod information (release may not manage pods)\n\n")
 
-            return result
+        return "".join(parts)
 
-        except json.JSONDecodeError as e:
-            return f"ERROR: Failed to parse health check data: {e}"
+
+# Shared by all helm_tool calls, so the command cache, resolved binary paths
+# and cluster identity persist across calls within the process
+_ANALYZER = HelmAnalyzer()
+
+# action -> (method, parsed-data method or None, required kwargs, optional kwargs with defaults)
+ACTIONS: Dict[str, tuple[str, Optional[str], tuple[str, ...], Dict[str, Any]]] = {
+    "list": ("list_releases", "_list_releases_parsed", (),
+             {"namespace": None, "all_namespaces": False}),
+    "details": ("get_release_details", "_release_details_parsed", ("release", "namespace"), {}),
+    "values": ("get_values", "_values_parsed", ("release", "namespace"), {"all_values": False}),
+    "manifest": ("get_manifest", None, ("release", "namespace"), {}),
+    "history": ("get_history", "_history_parsed", ("release", "namespace"), {"limit": 10}),
+    "compare": ("compare_revisions", None, ("release", "namespace", "revision1", "revision2"), {}),
+    "health": ("check_release_health", "_check_release_health_parsed", ("release", "namespace"), {}),
+}
+
+# The list action with detailed=True
+DETAILED_LIST_ACTION = ("list_releases_with_details", "_list_releases_with_details_parsed", (),
+                        {"namespace": None, "all_namespaces": False, "concurrency": 10})
+
+# Arguments that arrive as strings from tool calls but are used as numbers
+INT_ARGS = frozenset(("limit", "revision1", "revision2", "concurrency"))
+
+
+def _render_json(parsed: tuple[Any, Optional[str]]) -> str:
+    """Serialize a (data, error) result from a *_parsed method; errors pass through unchanged."""
+    data, error = parsed
+    return error if error else _json_dumps(data)
+
+
+def _resolve_call(action: str, kwargs: Dict[str, Any]) -> Union[str, tuple[Callable[..., Any], Dict[str, Any], bool]]:
+    """
+    Validate a helm_tool call and look up the method that serves it.
+
+    Args:
+        action: Action to perform
+        kwargs: Action-specific parameters
+
+    Returns:
+        An error message, or (bound method, its arguments, whether its result is rendered as JSON)
+
+    Raises:
+        ValueError: If a numeric argument isn't a number
+    """
+    output_format = kwargs.get("format", "markdown")
+    if output_format not in ("markdown", "json"):
+        return f"ERROR: Unknown format '{output_format}'. Valid formats: markdown, json"
+
+    if action == "list" and kwargs.get("detailed", False):
+        spec = DETAILED_LIST_ACTION
+    else:
+        spec = ACTIONS.get(action)
+    if spec is None:
+        return f"ERROR: Unknown action '{action}'. Valid actions: {', '.join(ACTIONS)}"
+
+    method_name, parsed_name, required, optional = spec
+
+    missing = [k for k in required if not kwargs.get(k)]
+    if missing:
+        names = [f"'{k}'" for k in required]
+        listed = " and ".join(names) if len(names) == 2 else ", ".join(names[:-1]) + f", and {names[-1]}"
+        return f"ERROR: {listed} parameters required for {action} action"
+
+    args = {k: kwargs[k] for k in required}
+    args.update((k, kwargs.get(k, default)) for k, default in optional.items())
+    for k in INT_ARGS.intersection(args):
+        args[k] = int(args[k])
+
+    as_json = output_format == "json" and parsed_name is not None
+    return getattr(_ANALYZER, parsed_name if as_json else method_name), args, as_json
 
 
 def helm_tool(action: str, **kwargs) -> str:
@@ -325,7 +1044,8 @@ def helm_tool(action: str, **kwargs) -> str:
     Kagent tool function for Helm analysis operations.
 
     Actions:
-    - list: List Helm releases (optional: namespace, all_namespaces=True)
+    - list: List Helm releases (optional: namespace, all_namespaces=True,
+            detailed=True to include per-release status details, concurrency=10)
     - details: Get release details (requires: release, namespace)
     - values: Get release values (requires: release, namespace; optional: all_values=True)
     - manifest: Get rendered manifests (requires: release, namespace)
@@ -333,6 +1053,9 @@ def helm_tool(action: str, **kwargs) -> str:
     - compare: Compare two revisions (requires: release, namespace, revision1, revision2)
     - health: Check release health (requires: release, namespace)
 
+    list, details, values, history and health also accept format="json" to
+    return the parsed data as JSON instead of Markdown.
+
     Args:
         action: Action to perform
         **kwargs: Action-specific parameters
@@ -340,69 +1063,72 @@ def helm_tool(action: str, **kwargs) -> str:
     Returns:
         String result from the action
 
+    Actions backed by coroutines (list with detailed=True, compare, health)
+    run on their own event loop here, on a worker thread if the caller is
+    already running one. Async callers can await helm_tool_async instead, so
+    the calls share their loop.
+
     Examples:
         helm_tool(action="list", all_namespaces=True)
+        helm_tool(action="list", all_namespaces=True, detailed=True, concurrency=10)
         helm_tool(action="details", release="prometheus", namespace="monitoring")
         helm_tool(action="values", release="nginx", namespace="default")
         helm_tool(action="history", release="myapp", namespace="production", limit=5)
         helm_tool(action="health", release="myapp", namespace="production")
+        helm_tool(action="health", release="myapp", namespace="production", format="json")
     """
-    analyzer = HelmAnalyzer()
-
     try:
-        if action == "list":
-            namespace = kwargs.get("namespace")
-            all_namespaces = kwargs.get("all_namespaces", False)
-            return analyzer.list_releases(namespace, all_namespaces)
-
-        elif action == "details":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            if not release or not namespace:
-                return "ERROR: 'release' and 'namespace' parameters required for details action"
-            return analyzer.get_release_details(release, namespace)
-
-        elif action == "values":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            all_values = kwargs.get("all_values", False)
-            if not release or not namespace:
-                return "ERROR: 'release' and 'namespace' parameters required for values action"
-            return analyzer.get_values(release, namespace, all_values)
-
-        elif action == "manifest":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            if not release or not namespace:
-                return "ERROR: 'release' and 'namespace' parameters required for manifest action"
-            return analyzer.get_manifest(release, namespace)
-
-        elif action == "history":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            limit = kwargs.get("limit", 10)
-            if not release or not namespace:
-                return "ERROR: 'release' and 'namespace' parameters required for history action"
-            return analyzer.get_history(release, namespace, limit)
-
-        elif action == "compare":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            revision1 = kwargs.get("revision1")
-            revision2 = kwargs.get("revision2")
-            if not all([release, namespace, revision1, revision2]):
-                return "ERROR: 'release', 'namespace', 'revision1', and 'revision2' parameters required for compare action"
-            return analyzer.compare_revisions(release, namespace, int(revision1), int(revision2))
-
-        elif action == "health":
-            release = kwargs.get("release")
-            namespace = kwargs.get("namespace")
-            if not release or not namespace:
-                return "ERROR: 'release' and 'namespace' parameters required for health action"
-            return analyzer.check_release_health(release, namespace)
-
+        call = _resolve_call(action, kwargs)
+        if isinstance(call, str):
+            return call
+        method, args, as_json = call
+
+        if inspect.iscoroutinefunction(method):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                result = asyncio.run(method(**args))
+            else:
+                # asyncio.run can't nest inside the caller's running loop, so
+                # give the coroutine its own loop on a worker thread
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    result = executor.submit(asyncio.run, method(**args)).result()
         else:
-            return f"ERROR: Unknown action '{action}'. Valid actions: list, details, values, manifest, history, compare, health"
+            result = method(**args)
+        return _render_json(result) if as_json else result
+
+    except Exception as e:
+        logger.exception("Helm tool error")
+        return f"ERROR: Helm tool failed: {e}"
+
+
+async def helm_tool_async(action: str, **kwargs) -> str:
+    """
+    Async variant of helm_tool, for callers running inside an event loop.
+
+    Coroutine-backed actions are awaited on the caller's loop; the others run
+    synchronously, as in helm_tool.
+
+    Args:
+        action: Action to perform (see helm_tool)
+        **kwargs: Action-specific parameters
+
+    Returns:
+        String result from the action
+
+    Examples:
+        await helm_tool_async(action="health", release="myapp", namespace="production")
+    """
+    try:
+        call = _resolve_call(action, kwargs)
+        if isinstance(call, str):
+            return call
+        method, args, as_json = call
+
+        result = method(**args)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return _render_json(result) if as_json else result
 
     except Exception as e:
         logger.exception("Helm tool error")
@@ -9,40 +9,163 @@ Provides intelligent analysis of container logs including:
 - Stack trace parsing
 """
 
+import functools
+import io
+import os
 import re
-from typing import List, Dict, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Any, Iterator, List, Dict, Optional, Sequence, Tuple, Union
 from datetime import datetime
-from collections import Counter
+from collections import Counter, OrderedDict, deque
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Try to import RE2 (google-re2), but make it optional; falls back to re
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Log content as given by the caller: text, or the raw UTF-8 bytes read from
+# the container runtime, which the RE2 scans consume without a decode
+Logs = Union[str, bytes]
+
+# UTF-8 of the non-ASCII characters that re.IGNORECASE folds onto an ASCII
+# letter but RE2 does not: long s (s), dotted capital I and dotless i (i),
+# Kelvin sign (k). Logs containing them are counted with re instead.
+_RE_ONLY_CASE_FOLDS = (b'\xc5\xbf', b'\xc4\xb0', b'\xc4\xb1', b'\xe2\x84\xaa')
+
+# Formatted results kept per analyzer, LRU-first eviction; the agent usually
+# runs several actions, and often the same one again, on one log blob
+RESULT_CACHE_MAX_SIZE = 32
+
+
+def _cached_result(method):
+    """
+    Memoize a LogAnalyzer method taking the logs as first argument.
+
+    Results are keyed by method, hash and length of the logs, and the other
+    arguments. The hash of a str is cached on the object, so repeated calls
+    with the same log blob do not rehash it, and the logs themselves are not
+    kept alive by the cache.
+    """
+    @functools.wraps(method)
+    def wrapper(self, logs, *args, **kwargs):
+        # Mutable buffers (bytearray) can change under the key, so skip them
+        if not logs or not isinstance(logs, (str, bytes)):
+            return method(self, logs, *args, **kwargs)
+        key = (method.__name__, hash(logs), len(logs), args, tuple(sorted(kwargs.items())))
+        with self._results_lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return result
+        result = method(self, logs, *args, **kwargs)
+        with self._results_lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > RESULT_CACHE_MAX_SIZE:
+                self._results.popitem(last=False)
+        return result
+    return wrapper
+
+
+def _as_bytes(logs: Logs) -> bytes:
+    """Return logs as UTF-8 bytes; lone surrogates in text round-trip."""
+    if isinstance(logs, str):
+        return logs.encode('utf-8', 'surrogatepass')
+    return bytes(logs)
+
+
+def _as_text(logs: Logs) -> str:
+    """Return logs as text; invalid UTF-8 in bytes becomes U+FFFD."""
+    if isinstance(logs, str):
+        return logs
+    return bytes(logs).decode('utf-8', 'replace')
+
+
+def _compile_bytes_re2(pattern: str):
+    """
+    Compile a case-insensitive RE2 pattern for scanning UTF-8 encoded logs.
+
+    The log is scanned as bytes in Latin-1 mode, so every byte matches . and
+    [^\\n] whatever the text, and no per-match offset decoding is needed;
+    the patterns themselves are ASCII.
+
+    Args:
+        pattern: Regex to compile
+
+    Returns:
+        Compiled RE2 pattern for use on UTF-8 encoded logs
+    """
+    return re2.compile(pattern.encode(), _bytes_re2_options())
+
+
+def _compile_bytes_re2_set(patterns: Sequence[str]):
+    """
+    Compile patterns into an RE2 set that reports which of them occur in a log.
+
+    Args:
+        patterns: Regexes to compile, matched with the same options as
+            _compile_bytes_re2
+
+    Returns:
+        Compiled RE2 search set; Match() returns the indices of the patterns found
+    """
+    pattern_set = re2.Set.SearchSet(_bytes_re2_options())
+    for pattern in patterns:
+        pattern_set.Add(pattern.encode())
+    pattern_set.Compile()
+    return pattern_set
+
+
+def _bytes_re2_options():
+    """Return RE2 options for case-insensitive Latin-1 scans of UTF-8 bytes."""
+    options = re2.Options()
+    options.encoding = re2.Options.Encoding.LATIN1
+    options.case_sensitive = False
+    return options
+
 
 class LogAnalyzer:
     """Analyzes container logs to extract insights and identify issues."""
 
-    # Common log level patterns
+    # Common log level patterns (all patterns here match case-insensitively)
     LOG_LEVEL_PATTERNS = {
-        'ERROR': r'(?i)(error|err|fatal|critical|crit|exception)',
-        'WARNING': r'(?i)(warning|warn)',
-        'INFO': r'(?i)(info|information)',
-        'DEBUG': r'(?i)(debug|trace)',
+        'ERROR': r'(error|err|fatal|critical|crit|exception)',
+        'WARNING': r'(warning|warn)',
+        'INFO': r'(info|information)',
+        'DEBUG': r'(debug|trace)',
     }
 
     # Common error patterns
     ERROR_PATTERNS = {
-        'connection_refused': r'(?i)connection refused',
-        'connection_timeout': r'(?i)(connection.*timeout|timeout.*connection)',
-        'no_such_host': r'(?i)(no such host|name resolution failed|could not resolve)',
-        'permission_denied': r'(?i)permission denied',
-        'out_of_memory': r'(?i)(out of memory|oom|cannot allocate memory)',
-        'file_not_found': r'(?i)(no such file|file not found|cannot find)',
-        'port_in_use': r'(?i)(address already in use|port.*already in use)',
-        'authentication_failed': r'(?i)(auth.*failed|authentication.*failed|invalid credentials)',
-        'database_error': r'(?i)(database.*error|sql.*error|connection pool)',
-        'network_unreachable': r'(?i)network.*unreachable',
-        'disk_full': r'(?i)(no space left|disk.*full)',
-        'certificate_error': r'(?i)(certificate.*error|tls.*error|ssl.*error)',
+        'connection_refused': r'connection refused',
+        'connection_timeout': r'(connection.*timeout|timeout.*connection)',
+        'no_such_host': r'(no such host|name resolution failed|could not resolve)',
+        'permission_denied': r'permission denied',
+        'out_of_memory': r'(out of memory|oom|cannot allocate memory)',
+        'file_not_found': r'(no such file|file not found|cannot find)',
+        'port_in_use': r'(address already in use|port.*already in use)',
+        'authentication_failed': r'(auth.*failed|authentication.*failed|invalid credentials)',
+        'database_error': r'(database.*error|sql.*error|connection pool)',
+        'network_unreachable': r'network.*unreachable',
+        'disk_full': r'(no space left|disk.*full)',
+        'certificate_error': r'(certificate.*error|tls.*error|ssl.*error)',
+    }
+
+    # Actions that need only the logs -> method running them, for batches
+    BATCH_ACTIONS = {
+        'extract_errors': 'extract_errors',
+        'extract_warnings': 'extract_warnings',
+        'identify_patterns': 'identify_patterns',
+        'parse_stack_traces': 'parse_stack_traces',
+        'summarize': 'summarize_logs',
+        'find_repeated': 'find_repeated_errors',
     }
 
     # Exit code meanings
@@ -58,16 +181,221 @@ class LogAnalyzer:
         143: "Terminated (SIGTERM) - Graceful shutdown signal",
     }
 
+    # Specific guidance for exit codes that have it
+    EXIT_CODE_GUIDANCE = {
+        137: (
+            "**Analysis:** Container was killed, likely by OOM (Out of Memory) killer.\n"
+            "**Investigation:** Check memory limits and actual memory usage.\n"
+            "**Solution:** Increase memory limits or optimize application memory usage.\n"
+        ),
+        143: (
+            "**Analysis:** Container received SIGTERM, typically during graceful shutdown.\n"
+            "**Investigation:** Check if application handles SIGTERM properly.\n"
+            "**Note:** This can be normal during rolling updates or pod termination.\n"
+        ),
+        1: (
+            "**Analysis:** Application exited with error status.\n"
+            "**Investigation:** Check application logs for error messages.\n"
+            "**Action:** Review the error logs to identify the specific failure.\n"
+        ),
+        127: (
+            "**Analysis:** Command not found in container.\n"
+            "**Investigation:** Check container ENTRYPOINT/CMD in Dockerfile.\n"
+            "**Solution:** Ensure the binary exists in the container image.\n"
+        ),
+    }
+
+    # Full report for every known exit code, formatted once at import
+    _EXIT_CODE_REPORTS: Dict[int, str] = {}
+    for _code, _explanation in EXIT_CODES.items():
+        _EXIT_CODE_REPORTS[_code] = f"**Exit Code {_code}:** {_explanation}\n\n" + EXIT_CODE_GUIDANCE.get(_code, "")
+    del _code, _explanation
+
+    # Patterns compiled once at import; methods call them directly instead of
+    # going through re's compile cache on every search
+    _LOG_LEVEL_RES = {level: re.compile(p, re.IGNORECASE) for level, p in LOG_LEVEL_PATTERNS.items()}
+
+    # With RE2, lines containing a level are found by one scan of the whole
+    # log in C instead of a Python loop calling search() on every line. Each
+    # match spans exactly one line containing the level.
+    _LEVEL_LINE_RE2S = (
+        {
+            level: _compile_bytes_re2(f'[^\\n]*{p}[^\\n]*')
+            for level, p in LOG_LEVEL_PATTERNS.items()
+        }
+        if RE2_AVAILABLE else {}
+    )
+
+    # (level, search) pairs in priority order for classifying a line. The
+    # first level that matches anywhere in the line wins, which a single
+    # alternation cannot express (it finds the leftmost level instead).
+    _LEVEL_SEARCHES = tuple((level, p.search) for level, p in _LOG_LEVEL_RES.items())
+
+    # Error patterns compiled once. Each is counted on its own: in a single
+    # alternation, greedy alternatives such as 'database.*error' would consume
+    # the rest of the line and hide other patterns that occur later on it.
+    _ERROR_RES = {name: re.compile(p, re.IGNORECASE) for name, p in ERROR_PATTERNS.items()}
+
+    # The same patterns for RE2, one per category for the same reason; each
+    # scan is a DFA pass linear in the log size. The set finds in one pass
+    # which categories occur at all, so only those are scanned and counted.
+    _ERROR_RE2S = (
+        {name: _compile_bytes_re2(p) for name, p in ERROR_PATTERNS.items()}
+        if RE2_AVAILABLE else {}
+    )
+    _ERROR_RE2_SET = _compile_bytes_re2_set(list(ERROR_PATTERNS.values())) if RE2_AVAILABLE else None
+
+    # Java/Kotlin stack trace start and continuation lines
+    _JAVA_TRACE_START_RE = re.compile(r'\s*(Exception|Error)')
+    _JAVA_TRACE_FRAME_RE = re.compile(r'\s*(at |\.\.\.)')
+
+    # Prefixes stripped from error lines before grouping repeats: an optional
+    # timestamp, then an optional [bracketed] field, then an optional LEVEL:,
+    # each at most once and in that order. Every part is optional, so the
+    # pattern always matches and its end is where the message starts.
+    _ERROR_PREFIX_RE = re.compile(
+        r'(?:\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[.,\d]*\s*)?'
+        r'(?:\[.*?\]\s*)?'
+        r'(?:[A-Z]+\s*:\s*)?'
+    )
+
     def __init__(self):
         """Initialize log analyzer."""
-        pass
+        # (source, lines) of the most recently split log. The source string
+        # is kept (not just its id) so the cache can never match a different
+        # string, and both are swapped in one assignment so concurrent
+        # analyses never see the lines of one log paired with another.
+        self._split: Tuple[Optional[Logs], List[str]] = (None, [])
+        self._results: OrderedDict = OrderedDict()
+        self._results_lock = threading.Lock()
+
+    def _lines(self, logs: Logs) -> List[str]:
+        """
+        Split logs into lines, reusing the result across back-to-back calls.
+
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+
+        Returns:
+            Log lines; shared with other callers, so must not be modified
+        """
+        source, lines = self._split
+        if logs is not source:
+            lines = _as_text(logs).split('\n')
+            self._split = (logs, lines)
+        return lines
+
+    def _iter_lines(self, logs: Logs) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over numbered log lines without building a list of them.
+
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+
+        Returns:
+            Iterator of (line number, line) pairs, numbered from 1, yielding
+            the same lines as logs.split('\n')
+        """
+        source, lines = self._split
+        if logs is source:
+            return enumerate(lines, 1)
+        text = _as_text(logs)
+        lines = (line.rstrip('\n') for line in io.StringIO(text))
+        if text.endswith('\n'):
+            lines = chain(lines, ('',))
+        return enumerate(lines, 1)
+
+    def _level_lines(self, logs: Logs, level: str) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate over numbered log lines that contain the given log level.
+
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+            level: Key of LOG_LEVEL_PATTERNS
+
+        Returns:
+            Iterator of (line number, line) pairs, numbered from 1
+        """
+        line_re = self._LEVEL_LINE_RE2S.get(level)
+        if line_re is None:
+            search = self._LOG_LEVEL_RES[level].search
+            return ((i, line) for i, line in self._iter_lines(logs) if search(line))
+        # Text is encoded with surrogatepass, so lines decode back the same
+        # way; raw bytes may hold invalid UTF-8, decoded as in _as_text
+        errors = 'surrogatepass' if isinstance(logs, str) else 'replace'
+        return self._scan_lines(_as_bytes(logs), line_re, errors)
+
+    @staticmethod
+    def _scan_lines(data: bytes, line_re, errors: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the numbered lines matched by a whole-line RE2 pattern.
+
+        Args:
+            data: UTF-8 encoded log content
+            line_re: Compiled RE2 pattern whose matches are whole lines
+            errors: Error handler for decoding the matched lines
 
-    def extract_errors(self, logs: str, limit: int = 50) -> str:
+        Returns:
+            Iterator of (line number, line) pairs, numbered from 1
+        """
+        lineno, pos = 1, 0
+        for m in line_re.finditer(data):
+            start = m.start()
+            lineno += data.count(b'\n', pos, start)
+            pos = start
+            yield lineno, m.group().decode('utf-8', errors)
+
+    def _first_level_lines(self, logs: Logs, level: str, limit: int) -> Tuple[List[str], bool]:
+        """
+        Format the first lines containing a log level, up to a limit.
+
+        Only limit lines are ever held, and scanning stops at the first
+        matching line past the limit, which is enough to know the output is
+        truncated.
+
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+            level: Key of LOG_LEVEL_PATTERNS
+            limit: Maximum number of lines to return
+
+        Returns:
+            Tuple of (formatted lines, whether more lines matched)
+        """
+        matches = self._level_lines(logs, level)
+        lines = [f"Line {i}: {line.strip()}" for i, line in islice(matches, max(limit, 0))]
+        return lines, next(matches, None) is not None
+
+    def _count_error_patterns(self, logs: Logs) -> Dict[str, int]:
+        """
+        Count occurrences of each known error pattern, independently of the others.
+
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+
+        Returns:
+            Pattern name -> count for patterns that occur, in ERROR_PATTERNS order
+        """
+        data = _as_bytes(logs) if self._ERROR_RE2_SET is not None else None
+        if data is not None and not any(fold in data for fold in _RE_ONLY_CASE_FOLDS):
+            # Match() returns None rather than an empty list when nothing occurs
+            found = set(self._ERROR_RE2_SET.Match(data) or ())
+            counts = {
+                name: sum(1 for _ in regex.finditer(data))
+                for i, (name, regex) in enumerate(self._ERROR_RE2S.items())
+                if i in found
+            }
+        else:
+            text = _as_text(logs)
+            counts = {name: sum(1 for _ in regex.finditer(text)) for name, regex in self._ERROR_RES.items()}
+        return {name: count for name, count in counts.items() if count}
+
+    @_cached_result
+    def extract_errors(self, logs: Logs, limit: int = 50) -> str:
         """
         Extract error lines from logs.
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
             limit: Maximum number of error lines to return
 
         Returns:
@@ -76,28 +404,23 @@ class LogAnalyzer:
         if not logs:
             return "No logs provided"
 
-        lines = logs.split('\n')
-        error_pattern = re.compile(self.LOG_LEVEL_PATTERNS['ERROR'])
+        errors, truncated = self._first_level_lines(logs, 'ERROR', limit)
 
-        errors = []
-        for i, line in enumerate(lines, 1):
-            if error_pattern.search(line):
-                errors.append(f"Line {i}: {line.strip()}")
+        if truncated:
+            return f"Found more than {limit} error lines (showing first {limit}):\n\n" + "\n".join(errors)
 
         if not errors:
             return "No error lines found in logs"
 
-        if len(errors) > limit:
-            return f"Found {len(errors)} error lines (showing first {limit}):\n\n" + "\n".join(errors[:limit])
-
         return f"Found {len(errors)} error line(s):\n\n" + "\n".join(errors)
 
-    def extract_warnings(self, logs: str, limit: int = 50) -> str:
+    @_cached_result
+    def extract_warnings(self, logs: Logs, limit: int = 50) -> str:
         """
         Extract warning lines from logs.
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
             limit: Maximum number of warning lines to return
 
         Returns:
@@ -106,28 +429,23 @@ class LogAnalyzer:
         if not logs:
             return "No logs provided"
 
-        lines = logs.split('\n')
-        warning_pattern = re.compile(self.LOG_LEVEL_PATTERNS['WARNING'])
+        warnings, truncated = self._first_level_lines(logs, 'WARNING', limit)
 
-        warnings = []
-        for i, line in enumerate(lines, 1):
-            if warning_pattern.search(line):
-                warnings.append(f"Line {i}: {line.strip()}")
+        if truncated:
+            return f"Found more than {limit} warning lines (showing first {limit}):\n\n" + "\n".join(warnings)
 
         if not warnings:
             return "No warning lines found in logs"
 
-        if len(warnings) > limit:
-            return f"Found {len(warnings)} warning lines (showing first {limit}):\n\n" + "\n".join(warnings[:limit])
-
         return f"Found {len(warnings)} warning line(s):\n\n" + "\n".join(warnings)
 
-    def identify_patterns(self, logs: str) -> str:
+    @_cached_result
+    def identify_patterns(self, logs: Logs) -> str:
         """
         Identify known error patterns in logs.
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
 
         Returns:
             Formatted list of identified patterns
@@ -135,29 +453,25 @@ class LogAnalyzer:
         if not logs:
             return "No logs provided"
 
-        matches = {}
-        for pattern_name, pattern in self.ERROR_PATTERNS.items():
-            regex = re.compile(pattern)
-            found = regex.findall(logs)
-            if found:
-                matches[pattern_name] = len(found)
+        matches = self._count_error_patterns(logs)
 
         if not matches:
             return "No known error patterns identified in logs"
 
-        result = "**Identified Error Patterns:**\n\n"
+        parts = ["**Identified Error Patterns:**\n\n"]
         for pattern_name, count in sorted(matches.items(), key=lambda x: x[1], reverse=True):
             friendly_name = pattern_name.replace('_', ' ').title()
-            result += f"- **{friendly_name}**: {count} occurrence(s)\n"
+            parts.append(f"- **{friendly_name}**: {count} occurrence(s)\n")
 
-        return result
+        return "".join(parts)
 
-    def parse_stack_traces(self, logs: str) -> str:
+    @_cached_result
+    def parse_stack_traces(self, logs: Logs) -> str:
         """
         Extract stack traces from logs.
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
 
         Returns:
             Formatted stack traces or message if none found
@@ -170,99 +484,140 @@ class LogAnalyzer:
         # Java: lines starting with "at " or "Caused by:"
         # Go: "panic:" followed by goroutine dump
 
-        stack_traces = []
-        lines = logs.split('\n')
-
-        # Python stack traces
-        i = 0
-        while i < len(lines):
-            if 'Traceback' in lines[i] or 'traceback' in lines[i]:
-                trace = [lines[i]]
-                i += 1
-                while i < len(lines) and (lines[i].startswith('  ') or lines[i].startswith('\t') or 'File' in lines[i] or 'Error' in lines[i]):
-                    trace.append(lines[i])
-                    i += 1
-                stack_traces.append('\n'.join(trace))
-            i += 1
-
-        # Java/Kotlin stack traces
-        i = 0
-        while i < len(lines):
-            if re.match(r'^\s*(Exception|Error)', lines[i]) or 'Caused by:' in lines[i]:
-                trace = [lines[i]]
-                i += 1
-                while i < len(lines) and (re.match(r'^\s*at ', lines[i]) or re.match(r'^\s*\.\.\.', lines[i]) or 'Caused by:' in lines[i]):
-                    trace.append(lines[i])
-                    i += 1
-                stack_traces.append('\n'.join(trace))
-            i += 1
-
-        # Go panics
-        i = 0
-        while i < len(lines):
-            if 'panic:' in lines[i]:
-                trace = [lines[i]]
-                i += 1
-                while i < len(lines) and (lines[i].startswith('goroutine') or re.match(r'^\s+', lines[i])):
-                    trace.append(lines[i])
-                    if 'goroutine' in lines[i] and i > 0:
-                        break
-                    i += 1
-                stack_traces.append('\n'.join(trace))
-            i += 1
+        # All three kinds are tracked in one pass, each with its own open
+        # trace, so a line can belong to traces of different kinds exactly as
+        # if every kind had its own scan. A line that ends a trace is not
+        # considered as the start of another trace of the same kind.
+        python_traces, java_traces, go_traces = [], [], []
+        python_trace = java_trace = go_trace = None
+        java_start = self._JAVA_TRACE_START_RE.match
+        java_frame = self._JAVA_TRACE_FRAME_RE.match
+
+        for _, line in self._iter_lines(logs):
+            # Python stack traces
+            if python_trace is not None:
+                if line.startswith(('  ', '\t')) or 'File' in line or 'Error' in line:
+                    python_trace.append(line)
+                else:
+                    python_traces.append('\n'.join(python_trace))
+                    python_trace = None
+            elif 'Traceback' in line or 'traceback' in line:
+                python_trace = [line]
+
+            # Java/Kotlin stack traces
+            if java_trace is not None:
+                if java_frame(line) or 'Caused by:' in line:
+                    java_trace.append(line)
+                else:
+                    java_traces.append('\n'.join(java_trace))
+                    java_trace = None
+            elif java_start(line) or 'Caused by:' in line:
+                java_trace = [line]
+
+            # Go panics: a goroutine header closes the trace
+            if go_trace is not None:
+                if line.startswith('goroutine') or line[:1].isspace():
+                    go_trace.append(line)
+                    if 'goroutine' in line:
+                        go_traces.append('\n'.join(go_trace))
+                        go_trace = None
+                else:
+                    go_traces.append('\n'.join(go_trace))
+                    go_trace = None
+            elif 'panic:' in line:
+                go_trace = [line]
+
+        for kind_traces, trace in ((python_traces, python_trace), (java_traces, java_trace), (go_traces, go_trace)):
+            if trace is not None:
+                kind_traces.append('\n'.join(trace))
+        stack_traces = python_traces + java_traces + go_traces
 
         if not stack_traces:
             return "No stack traces found in logs"
 
-        result = f"**Found {len(stack_traces)} Stack Trace(s):**\n\n"
+        parts = [f"**Found {len(stack_traces)} Stack Trace(s):**\n\n"]
         for idx, trace in enumerate(stack_traces, 1):
-            result += f"### Stack Trace {idx}\n```\n{trace}\n```\n\n"
+            parts.append(f"### Stack Trace {idx}\n```\n{trace}\n```\n\n")
 
-        return result
+        return "".join(parts)
 
-    def analyze_exit_code(self, exit_code: int) -> str:
+    def analyze_all(self, logs: Logs, actions: Sequence[str] = tuple(BATCH_ACTIONS)) -> Dict[str, str]:
         """
-        Interpret container exit code.
+        Run several analyses of the same logs concurrently.
+
+        Each action runs with its default options on a thread pool. The
+        analyses are independent, and the RE2 scans they spend most of their
+        time in run in C.
 
         Args:
-            exit_code: Container exit code
+            logs: Raw log content (text or UTF-8 bytes)
+            actions: Keys of BATCH_ACTIONS to run
 
         Returns:
-            Human-readable explanation of exit code
+            Action -> formatted result, in the order given
+
+        Raises:
+            ValueError: If an action is not in BATCH_ACTIONS
+        """
+        unknown = [action for action in actions if action not in self.BATCH_ACTIONS]
+        if unknown:
+            raise ValueError(f"Unknown batch action(s): {', '.join(unknown)}")
+
+        # Split once up front so the analyses share the line list
+        if logs:
+            self._lines(logs)
+
+        methods = [getattr(self, self.BATCH_ACTIONS[action]) for action in actions]
+        with ThreadPoolExecutor(max_workers=max(1, min(len(methods), os.cpu_count() or 1))) as executor:
+            results = list(executor.map(lambda method: method(logs), methods))
+        return dict(zip(actions, results))
+
+    def batch_report(self, logs: Logs, actions: Optional[Union[str, Sequence[str]]] = None) -> str:
         """
-        explanation = self.EXIT_CODES.get(exit_code, "Unknown exit code")
+        Run several analyses concurrently and format them as one report.
 
-        result = f"**Exit Code {exit_code}:** {explanation}\n\n"
+        Args:
+            logs: Raw log content (text or UTF-8 bytes)
+            actions: Keys of BATCH_ACTIONS, as a list or comma-separated string
+                (default: all of them)
 
-        # Add specific guidance
-        if exit_code == 137:
-            result += "**Analysis:** Container was killed, likely by OOM (Out of Memory) killer.\n"
-            result += "**Investigation:** Check memory limits and actual memory usage.\n"
-            result += "**Solution:** Increase memory limits or optimize application memory usage.\n"
+        Returns:
+            One section per action, or an error message for unknown actions
+        """
+        if not actions:
+            actions = tuple(self.BATCH_ACTIONS)
+        elif isinstance(actions, str):
+            actions = [a.strip() for a in actions.split(",") if a.strip()]
 
-        elif exit_code == 143:
-            result += "**Analysis:** Container received SIGTERM, typically during graceful shutdown.\n"
-            result += "**Investigation:** Check if application handles SIGTERM properly.\n"
-            result += "**Note:** This can be normal during rolling updates or pod termination.\n"
+        unknown = [a for a in actions if a not in self.BATCH_ACTIONS]
+        if unknown:
+            return f"ERROR: Unknown batch action(s): {', '.join(unknown)}. Valid actions: {', '.join(self.BATCH_ACTIONS)}"
 
-        elif exit_code == 1:
-            result += "**Analysis:** Application exited with error status.\n"
-            result += "**Investigation:** Check application logs for error messages.\n"
-            result += "**Action:** Review the error logs to identify the specific failure.\n"
+        results = self.analyze_all(logs, actions)
+        return "\n\n".join(f"## {name}\n\n{result}" for name, result in results.items())
 
-        elif exit_code == 127:
-            result += "**Analysis:** Command not found in container.\n"
-            result += "**Investigation:** Check container ENTRYPOINT/CMD in Dockerfile.\n"
-            result += "**Solution:** Ensure the binary exists in the container image.\n"
+    def analyze_exit_code(self, exit_code: int) -> str:
+        """
+        Interpret container exit code.
 
-        return result
+        Args:
+            exit_code: Container exit code
+
+        Returns:
+            Human-readable explanation of exit code
+        """
+        report = self._EXIT_CODE_REPORTS.get(exit_code)
+        if report is None:
+            return f"**Exit Code {exit_code}:** Unknown exit code\n\n"
+        return report
 
-    def summarize_logs(self, logs: str, tail_lines: int = 50) -> str:
+    @_cached_result
+    def summarize_logs(self, logs: Logs, tail_lines: int = 50) -> str:
         """
         Create a summary of logs with key statistics.
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
             tail_lines: Number of recent lines to include
 
         Returns:
@@ -271,55 +626,58 @@ class LogAnalyzer:
         if not logs:
             return "No logs provided"
 
-        lines = logs.split('\n')
-        total_lines = len(lines)
-
-        # Count log levels
+        # Count lines and log levels in one streaming pass, keeping only the
+        # tail; error patterns are counted by a single scan of the whole
+        # buffer, which is cheaper than running the combined pattern line by
+        # line
+        level_searches = self._LEVEL_SEARCHES
         level_counts = Counter()
-        for line in lines:
-            for level, pattern in self.LOG_LEVEL_PATTERNS.items():
-                if re.search(pattern, line):
+        tail = deque(maxlen=max(tail_lines, 0))
+        total_lines = 0
+        for total_lines, line in self._iter_lines(logs):
+            tail.append(line)
+            for level, search in level_searches:
+                if search(line):
                     level_counts[level] += 1
                     break
 
-        # Count error patterns
-        pattern_counts = {}
-        for pattern_name, pattern in self.ERROR_PATTERNS.items():
-            count = len(re.findall(pattern, logs))
-            if count > 0:
-                pattern_counts[pattern_name] = count
+        # A non-positive count slices from the front, so it needs the full list
+        if tail_lines <= 0:
+            tail = self._lines(logs)[-tail_lines:]
+
+        pattern_counts = self._count_error_patterns(logs)
 
         # Build summary
-        result = "# Log Summary\n\n"
-        result += f"**Total Lines:** {total_lines}\n\n"
+        parts = ["# Log Summary\n\n", f"**Total Lines:** {total_lines}\n\n"]
 
         if level_counts:
-            result += "## Log Level Distribution\n"
+            parts.append("## Log Level Distribution\n")
             for level, count in level_counts.most_common():
-                result += f"- {level}: {count}\n"
-            result += "\n"
+                parts.append(f"- {level}: {count}\n")
+            parts.append("\n")
 
         if pattern_counts:
-            result += "## Error Patterns Detected\n"
+            parts.append("## Error Patterns Detected\n")
             for pattern, count in sorted(pattern_counts.items(), key=lambda x: x[1], reverse=True):
                 friendly_name = pattern.replace('_', ' ').title()
-                result += f"- {friendly_name}: {count}\n"
-            result += "\n"
+                parts.append(f"- {friendly_name}: {count}\n")
+            parts.append("\n")
 
         # Add tail of logs
         if total_lines > 0:
-            result += f"## Last {min(tail_lines, total_lines)} Lines\n\n```\n"
-            result += '\n'.join(lines[-tail_lines:])
-            result += "\n```\n"
+            parts.append(f"## Last {min(tail_lines, total_lines)} Lines\n\n```\n")
+            parts.append('\n'.join(tail))
+            parts.append("\n```\n")
 
-        return result
+        return "".join(parts)
 
-    def find_repeated_errors(self, logs: str, min_occurrences: int = 3) -> str:
+    @_cached_result
+    def find_repeated_errors(self, logs: Logs, min_occurrences: int = 3) -> str:
         """
         Find errors that repeat multiple times (potential loops or persistent issues).
 
         Args:
-            logs: Raw log content
+            logs: Raw log content (text or UTF-8 bytes)
             min_occurrences: Minimum number of occurrences to report
 
         Returns:
@@ -328,38 +686,52 @@ class LogAnalyzer:
         if not logs:
             return "No logs provided"
 
-        lines = logs.split('\n')
-        error_pattern = re.compile(self.LOG_LEVEL_PATTERNS['ERROR'])
+        prefix_match = self._ERROR_PREFIX_RE.match
 
         # Extract error messages (strip timestamps and common prefixes)
-        error_messages = []
-        for line in lines:
-            if error_pattern.search(line):
-                # Try to extract the error message without timestamp
-                # Common formats: "2024-01-01 12:00:00 ERROR message" or "[ERROR] message"
-                cleaned = re.sub(r'^\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[.,\d]*\s*', '', line)
-                cleaned = re.sub(r'^\[.*?\]\s*', '', cleaned)
-                cleaned = re.sub(r'^[A-Z]+\s*:\s*', '', cleaned)
-                if cleaned:
-                    error_messages.append(cleaned.strip())
-
-        if not error_messages:
+        # Try to extract the error message without timestamp
+        # Common formats: "2024-01-01 12:00:00 ERROR message" or "[ERROR] message"
+        cleaned = (line[prefix_match(line).end():] for _, line in self._level_lines(logs, 'ERROR'))
+
+        # Count occurrences as messages are produced; Counter consumes the
+        # generator in C, and no list of every error message is built
+        message_counts = Counter(msg.strip() for msg in cleaned if msg)
+
+        if not message_counts:
             return "No error messages found in logs"
 
-        # Count occurrences
-        message_counts = Counter(error_messages)
         repeated = {msg: count for msg, count in message_counts.items() if count >= min_occurrences}
 
         if not repeated:
             return f"No errors repeated {min_occurrences}+ times"
 
-        result = f"**Repeated Errors (occurring {min_occurrences}+ times):**\n\n"
+        parts = [f"**Repeated Errors (occurring {min_occurrences}+ times):**\n\n"]
         for msg, count in sorted(repeated.items(), key=lambda x: x[1], reverse=True):
-            result += f"- **{count} times:** {msg[:200]}{'...' if len(msg) > 200 else ''}\n"
+            parts.append(f"- **{count} times:** {msg[:200]}{'...' if len(msg) > 200 else ''}\n")
 
-        result += f"\n**Analysis:** Repeated errors suggest a persistent issue or error loop.\n"
+        parts.append(f"\n**Analysis:** Repeated errors suggest a persistent issue or error loop.\n")
 
-        return result
+        return "".join(parts)
+
+
+# Shared by all log_tool calls, so back-to-back actions on the same logs reuse
+# its line split and result cache; its mutable state is safe across threads
+_ANALYZER = LogAnalyzer()
+
+# action -> (method, required kwarg, optional kwargs with defaults)
+ACTIONS: Dict[str, Tuple[str, str, Dict[str, Any]]] = {
+    "extract_errors": ("extract_errors", "logs", {"limit": 50}),
+    "extract_warnings": ("extract_warnings", "logs", {"limit": 50}),
+    "identify_patterns": ("identify_patterns", "logs", {}),
+    "parse_stack_traces": ("parse_stack_traces", "logs", {}),
+    "analyze_exit_code": ("analyze_exit_code", "exit_code", {}),
+    "summarize": ("summarize_logs", "logs", {"tail_lines": 50}),
+    "find_repeated": ("find_repeated_errors", "logs", {"min_occurrences": 3}),
+    "batch": ("batch_report", "logs", {"actions": None}),
+}
+
+# Arguments that may arrive as strings from tool calls but are used as numbers
+INT_ARGS = frozenset(("exit_code", "limit", "tail_lines", "min_occurrences"))
 
 
 def log_tool(action: str, **kwargs) -> str:
@@ -374,6 +746,8 @@ def log_tool(action: str, **kwargs) -> str:
     - analyze_exit_code: Interpret exit code (requires: exit_code)
     - summarize: Create log summary (requires: logs; optional: tail_lines=50)
     - find_repeated: Find repeated error messages (requires: logs; optional: min_occurrences=3)
+    - batch: Run several of the log actions above concurrently with their defaults
+      (requires: logs; optional: actions=all of them)
 
     Args:
         action: Action to perform
@@ -387,58 +761,24 @@ def log_tool(action: str, **kwargs) -> str:
         log_tool(action="identify_patterns", logs=pod_logs)
         log_tool(action="analyze_exit_code", exit_code=137)
         log_tool(action="summarize", logs=pod_logs)
+        log_tool(action="batch", logs=pod_logs, actions=["extract_errors", "identify_patterns"])
     """
-    analyzer = LogAnalyzer()
+    analyzer = _ANALYZER
 
-    try:
-        if action == "extract_errors":
-            logs = kwargs.get("logs")
-            limit = kwargs.get("limit", 50)
-            if logs is None:
-                return "ERROR: 'logs' parameter required for extract_errors action"
-            return analyzer.extract_errors(logs, limit)
-
-        elif action == "extract_warnings":
-            logs = kwargs.get("logs")
-            limit = kwargs.get("limit", 50)
-            if logs is None:
-                return "ERROR: 'logs' parameter required for extract_warnings action"
-            return analyzer.extract_warnings(logs, limit)
-
-        elif action == "identify_patterns":
-            logs = kwargs.get("logs")
-            if logs is None:
-                return "ERROR: 'logs' parameter required for identify_patterns action"
-            return analyzer.identify_patterns(logs)
-
-        elif action == "parse_stack_traces":
-            logs = kwargs.get("logs")
-            if logs is None:
-                return "ERROR: 'logs' parameter required for parse_stack_traces action"
-            return analyzer.parse_stack_traces(logs)
-
-        elif action == "analyze_exit_code":
-            exit_code = kwargs.get("exit_code")
-            if exit_code is None:
-                return "ERROR: 'exit_code' parameter required for analyze_exit_code action"
-            return analyzer.analyze_exit_code(int(exit_code))
-
-        elif action == "summarize":
-            logs = kwargs.get("logs")
-            tail_lines = kwargs.get("tail_lines", 50)
-            if logs is None:
-                return "ERROR: 'logs' parameter required for summarize action"
-            return analyzer.summarize_logs(logs, tail_lines)
-
-        elif action == "find_repeated":
-            logs = kwargs.get("logs")
-            min_occurrences = kwargs.get("min_occurrences", 3)
-            if logs is None:
-                return "ERROR: 'logs' parameter required for find_repeated action"
-            return analyzer.find_repeated_errors(logs, min_occurrences)
+    spec = ACTIONS.get(action)
+    if spec is None:
+        return f"ERROR: Unknown action '{action}'. Valid actions: {', '.join(ACTIONS)}"
 
-        else:
-            return f"ERROR: Unknown action '{action}'. Valid actions: extract_errors, extract_warnings, identify_patterns, parse_stack_traces, analyze_exit_code, summarize, find_repeated"
+    method_name, required, optional = spec
+    if kwargs.get(required) is None:
+        return f"ERROR: '{required}' parameter required for {action} action"
+
+    try:
+        args = {required: kwargs[required]}
+        args.update((k, kwargs.get(k, default)) for k, default in optional.items())
+        for k in INT_ARGS.intersection(args):
+            args[k] = int(args[k])
+        return getattr(analyzer, method_name)(**args)
 
     except Exception as e:
         logger.exception("Log tool error")
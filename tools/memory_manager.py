@@ -11,14 +11,168 @@ The knowledge base is stored at /agent-memory/ and includes:
 - reports/ - Saved incident reports
 """
 
+import bisect
+import functools
+import heapq
+import mmap
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# posix_fadvise is not available on every platform (e.g. macOS, Windows)
+FADVISE_AVAILABLE = hasattr(os, "posix_fadvise")
+# fdatasync skips the metadata flush of fsync; not available on macOS
+_datasync = getattr(os, "fdatasync", os.fsync)
+# Files at least this large are read with a sequential-access hint
+SEQUENTIAL_READ_MIN_SIZE = 1024 * 1024
+# Upper bound on threads used by read_many
+READ_MANY_MAX_WORKERS = 8
+# Files at least this large are searched through mmap instead of being read and decoded
+MMAP_MIN_SIZE = 64 * 1024
+
+_NEWLINE_RE = re.compile(r'\n')
+# Runs of characters not safe in a report filename. A str.translate table is
+# marginally faster per name but maps characters one-to-one, so it can't
+# collapse runs into a single '-'.
+_SANITIZE_RE = re.compile(r'[^a-z0-9_-]+')
+
+
+def _decode(raw: bytes) -> str:
+    """
+    Decode file bytes the way a text-mode read would.
+
+    Args:
+        raw: File content as read from disk
+
+    Returns:
+        UTF-8 decoded text with CRLF and CR newlines translated to LF
+    """
+    text = raw.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file, hinting sequential access for large ones.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content
+    """
+    with open(path, 'rb') as f:
+        if FADVISE_AVAILABLE and os.fstat(f.fileno()).st_size >= SEQUENTIAL_READ_MIN_SIZE:
+            # Larger readahead window, fewer blocking reads
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f.read()
+
+
+def _search_text(text: str, search_term: str) -> Tuple[int, str]:
+    """
+    Find the lines of a text that contain a term, ignoring case.
+
+    Args:
+        text: Decoded file content
+        search_term: Term to search for
+
+    Returns:
+        Number of matching lines, and their "Line N: ..." entries joined by newlines
+    """
+    needle = re.compile(re.escape(search_term), re.IGNORECASE)
+
+    matches = []
+    match = needle.search(text)
+    if match:
+        # Offset of each line start, so a hit maps to its line by bisection
+        line_starts = [0] + [m.end() for m in _NEWLINE_RE.finditer(text)]
+        while match:
+            i = bisect.bisect_right(line_starts, match.start())
+            start = line_starts[i - 1]
+            end = line_starts[i] if i < len(line_starts) else len(text)
+            matches.append(f"Line {i}: {text[start:end].rstrip()}")
+            # One entry per line: resume the scan at the next line
+            match = needle.search(text, end)
+    return len(matches), "\n".join(matches)
+
+
+def _search_mapped(path: Path, search_term: str) -> Optional[Tuple[int, str]]:
+    """
+    Like _search_text, but scan the file's pages in place through mmap.
+
+    Matching lines are copied as bytes into one buffer that is decoded once at
+    the end. Requires an ASCII search term, for which byte-level case folding
+    is equivalent.
+
+    Args:
+        path: File to search
+        search_term: ASCII term to search for
+
+    Returns:
+        Same as _search_text, or None if the file uses CR line endings and
+        needs the newline translation of a text-mode read
+    """
+    needle = re.compile(re.escape(search_term.encode('ascii')), re.IGNORECASE)
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b'\r') != -1:
+            return None
+
+        buf = bytearray()
+        count = 0
+        lineno, counted = 1, 0
+        match = needle.search(mm)
+        while match:
+            start = mm.rfind(b'\n', 0, match.start()) + 1
+            end = mm.find(b'\n', match.start())
+            if end == -1:
+                end = len(mm)
+            lineno += mm[counted:start].count(b'\n')
+            counted = start
+            line = mm[start:end].rstrip()
+            if line and (line[-1] >= 0x80 or 0x1c <= line[-1] <= 0x1f):
+                # Trailing whitespace only str.rstrip knows about (e.g. U+00A0)
+                line = line.decode('utf-8').rstrip().encode('utf-8')
+            buf += b"Line %d: %b\n" % (lineno, line)
+            count += 1
+            match = needle.search(mm, end + 1)
+    return count, buf[:-1].decode('utf-8')
+
+
+def _write_fd(path: Path, data: bytes, flags: int, drop_cache: bool = False,
+              durable: bool = False) -> None:
+    """
+    Write bytes to a file through a raw descriptor, without buffered/text I/O layers.
+
+    Args:
+        path: File to open
+        data: Encoded content
+        flags: os.open flags in addition to O_WRONLY
+        drop_cache: Advise the kernel that the written pages won't be read again
+        durable: Flush the data to disk before returning
+    """
+    fd = os.open(path, os.O_WRONLY | flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than asked for (large buffers, signals)
+            view = view[os.write(fd, view):]
+        if durable:
+            _datasync(fd)
+        # After a flush the pages are clean, so DONTNEED can drop them right away
+        if drop_cache and FADVISE_AVAILABLE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
 
 class MemoryManager:
     """Manages agent's persistent memory stored in markdown files."""
@@ -31,60 +185,140 @@ class MemoryManager:
             memory_path: Path to agent memory directory (default: /agent-memory)
         """
         self.memory_path = Path(memory_path)
+        # Not created here: write_file makes it on the first save_report
         self.reports_path = self.memory_path / "reports"
-
-        # Ensure reports directory exists
-        if self.memory_path.exists():
-            self.reports_path.mkdir(exist_ok=True)
+        # ({directory: mtime_ns}, sorted file list) from the last list_files walk
+        self._list_cache: Optional[Tuple[Dict[str, int], List[str]]] = None
 
     def list_files(self) -> List[str]:
         """
         List all files in agent memory.
 
+        The result is cached until the mtime of a directory in the tree changes,
+        or until a file is written through this manager.
+
         Returns:
             List of relative file paths
         """
-        if not self.memory_path.exists():
-            return []
-
+        cached = self._list_cache
+        if cached is not None:
+            try:
+                if all(os.stat(d).st_mtime_ns == mtime for d, mtime in cached[0].items()):
+                    return list(cached[1])
+            except OSError:
+                pass
+
+        root = str(self.memory_path)
+        base_len = len(os.path.join(root, ""))
+        mtimes = {}
         files = []
-        for item in self.memory_path.rglob("*.md"):
-            relative_path = item.relative_to(self.memory_path)
-            files.append(str(relative_path))
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                # Stat before listing, so an entry added mid-walk invalidates the cache
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            files.append(entry.path[base_len:])
+            except OSError:
+                if directory == root:
+                    return []
+                # Subdirectory vanished or is unreadable: skip it, as rglob did
+
+        files.sort()
+        self._list_cache = (mtimes, files)
+        return list(files)
+
+    def load_file(self, filename: str) -> str:
+        """
+        Read content from a memory file, raising if it can't be read.
+
+        Args:
+            filename: Relative path to file
+
+        Returns:
+            File content as string
 
-        return sorted(files)
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        raw = _read_bytes(self.memory_path / filename)
+        logger.info(f"Read {len(raw)} bytes from {filename}")
+        return _decode(raw)
 
     def read_file(self, filename: str) -> str:
         """
         Read content from a memory file.
 
+        A missing file costs one failed open; the tree is only listed (from the
+        list_files cache) to build the error message.
+
         Args:
             filename: Relative path to file (e.g., "known-issues.md" or "reports/2025-10-11-incident-001.md")
 
         Returns:
             File content as string, or error message if file doesn't exist
         """
-        file_path = self.memory_path / filename
-
-        if not file_path.exists():
+        try:
+            return self.load_file(filename)
+        except FileNotFoundError:
             return f"ERROR: File '{filename}' not found in memory. Available files: {', '.join(self.list_files())}"
+        except Exception as e:
+            logger.error(f"Failed to read {filename}: {e}")
+            return f"ERROR: Failed to read file: {e}"
 
+    def read_many(self, filenames: Sequence[str]) -> Dict[str, str]:
+        """
+        Read several memory files in one call.
+
+        Files are read on a small thread pool: the work is I/O-bound and the GIL
+        is released while waiting on the disk, so threads (not processes) let
+        page-cache misses overlap. Files are opened directly rather than probed
+        with exists() first.
+
+        Args:
+            filenames: Relative paths to files
+
+        Returns:
+            Dict mapping each filename to its content, or to an error message
+        """
+        filenames = list(dict.fromkeys(filenames))
+        if len(filenames) <= 1:
+            # Not worth starting a pool for
+            contents = [self._read_one(filename) for filename in filenames]
+        else:
+            with ThreadPoolExecutor(max_workers=min(READ_MANY_MAX_WORKERS, len(filenames))) as executor:
+                contents = list(executor.map(self._read_one, filenames))
+
+        logger.info(f"Read {len(filenames)} files from memory")
+        return dict(zip(filenames, contents))
+
+    def _read_one(self, filename: str) -> str:
+        """Read one file for read_many, returning an error message on failure."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            logger.info(f"Read {len(content)} bytes from {filename}")
-            return content
+            return self.load_file(filename)
+        except FileNotFoundError:
+            return f"ERROR: File '{filename}' not found in memory"
         except Exception as e:
             logger.error(f"Failed to read {filename}: {e}")
             return f"ERROR: Failed to read file: {e}"
 
-    def write_file(self, filename: str, content: str) -> str:
+    def write_file(self, filename: str, content: str, *, drop_cache: bool = False,
+                   durable: bool = False) -> str:
         """
         Write content to a memory file.
 
         Args:
             filename: Relative path to file
             content: Content to write
+            drop_cache: Keep the written pages out of the page cache, for files
+                that won't be read back soon (e.g. incident reports)
+            durable: fdatasync before returning, for content that must survive a
+                crash; by default the write is left to kernel write-back
 
         Returns:
             Success message or error message
@@ -95,8 +329,9 @@ class MemoryManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _write_fd(file_path, content.encode('utf-8'), os.O_CREAT | os.O_TRUNC, drop_cache, durable)
+            # Directory mtimes can be too coarse to notice a new file
+            self._list_cache = None
             logger.info(f"Wrote {len(content)} bytes to {filename}")
             return f"SUCCESS: Wrote {len(content)} bytes to {filename}"
         except Exception as e:
@@ -120,8 +355,7 @@ class MemoryManager:
             return f"ERROR: File '{filename}' not found. Use write_file to create it first."
 
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(content)
+            _write_fd(file_path, content.encode('utf-8'), os.O_APPEND)
             logger.info(f"Appended {len(content)} bytes to {filename}")
             return f"SUCCESS: Appended {len(content)} bytes to {filename}"
         except Exception as e:
@@ -145,20 +379,17 @@ class MemoryManager:
             return f"ERROR: File '{filename}' not found"
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            matches = []
-            search_term_lower = search_term.lower()
-
-            for i, line in enumerate(lines, 1):
-                if search_term_lower in line.lower():
-                    matches.append(f"Line {i}: {line.rstrip()}")
-
-            if not matches:
+            result = None
+            if search_term.isascii() and file_path.stat().st_size >= MMAP_MIN_SIZE:
+                result = _search_mapped(file_path, search_term)
+            if result is None:
+                result = _search_text(file_path.read_text(encoding='utf-8'), search_term)
+
+            count, listing = result
+            if not count:
                 return f"No matches found for '{search_term}' in {filename}"
 
-            return f"Found {len(matches)} matches in {filename}:\n" + "\n".join(matches)
+            return f"Found {count} matches in {filename}:\n" + listing
 
         except Exception as e:
             logger.error(f"Failed to search {filename}: {e}")
@@ -175,14 +406,16 @@ class MemoryManager:
         Returns:
             Success message with filename, or error message
         """
-        # Generate filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d-%H%M%S")
+        # Generate filename with timestamp; the low bits of the ns clock keep
+        # reports saved within the same second from overwriting each other
+        now_ns = time.time_ns()
+        timestamp = time.strftime("%Y-%m-%d-%H%M%S", time.gmtime(now_ns // 1_000_000_000))
+        timestamp += f"-{now_ns & 0xFFFF:04x}"
         # Sanitize alert name for filename
-        safe_alert_name = "".join(c if c.isalnum() or c in ('-', '_') else '-'
-                                   for c in alert_name.lower())
+        safe_alert_name = _SANITIZE_RE.sub('-', alert_name.lower()).strip('-') or 'alert'
         filename = f"reports/{timestamp}-{safe_alert_name}.md"
 
-        result = self.write_file(filename, content)
+        result = self.write_file(filename, content, drop_cache=True, durable=True)
 
         if result.startswith("SUCCESS"):
             return f"SUCCESS: Report saved as {filename}"
@@ -198,11 +431,21 @@ class MemoryManager:
         Returns:
             List of report filenames, newest first
         """
-        if not self.reports_path.exists():
+        try:
+            with os.scandir(self.reports_path) as it:
+                entries = [e for e in it if e.name.endswith('.md') and e.is_file()]
+        except FileNotFoundError:
             return []
 
-        reports = sorted(self.reports_path.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-        return [f"reports/{r.name}" for r in reports[:limit]]
+        # Partial sort: only the newest `limit` entries are ordered
+        reports = heapq.nlargest(limit, entries, key=lambda e: e.stat().st_mtime_ns)
+        return [f"reports/{r.name}" for r in reports]
+
+
+@functools.lru_cache(maxsize=4)
+def _get_manager(memory_path: str) -> MemoryManager:
+    """Return the shared MemoryManager for a memory path."""
+    return MemoryManager(memory_path)
 
 
 def memory_tool(action: str, **kwargs) -> str:
@@ -212,6 +455,7 @@ def memory_tool(action: str, **kwargs) -> str:
     Actions:
     - list: List all files in memory (no params)
     - read: Read file content (requires: filename)
+    - read_many: Read several files (requires: filenames, as a list or comma-separated string)
     - write: Write file content (requires: filename, content)
     - append: Append to existing file (requires: filename, content)
     - search: Search for term in file (requires: filename, search_term)
@@ -228,11 +472,12 @@ def memory_tool(action: str, **kwargs) -> str:
     Examples:
         memory_tool(action="list")
         memory_tool(action="read", filename="known-issues.md")
+        memory_tool(action="read_many", filenames=["known-issues.md", "discovered-tools.md"])
         memory_tool(action="write", filename="discovered-tools.md", content="# Tools\\n...")
         memory_tool(action="search", filename="known-issues.md", search_term="OOMKilled")
         memory_tool(action="save_report", alert_name="KubePodCrashLooping", content="# Report\\n...")
     """
-    manager = MemoryManager()
+    manager = _get_manager(os.environ.get("MEMORY_PATH", "/agent-memory"))
 
     try:
         if action == "list":
@@ -247,6 +492,15 @@ def memory_tool(action: str, **kwargs) -> str:
                 return "ERROR: 'filename' parameter required for read action"
             return manager.read_file(filename)
 
+        elif action == "read_many":
+            filenames = kwargs.get("filenames")
+            if isinstance(filenames, str):
+                filenames = [f.strip() for f in filenames.split(",") if f.strip()]
+            if not filenames:
+                return "ERROR: 'filenames' parameter required for read_many action"
+            contents = manager.read_many(filenames)
+            return "\n\n".join(f"## {name}\n\n{content}" for name, content in contents.items())
+
         elif action == "write":
             filename = kwargs.get("filename")
             content = kwargs.get("content")
@@ -283,7 +537,7 @@ def memory_tool(action: str, **kwargs) -> str:
             return "Recent reports:\n" + "\n".join(f"  - {r}" for r in reports)
 
         else:
-            return f"ERROR: Unknown action '{action}'. Valid actions: list, read, write, append, search, save_report, recent_reports"
+            return f"ERROR: Unknown action '{action}'. Valid actions: list, read, read_many, write, append, search, save_report, recent_reports"
 
     except Exception as e:
         logger.exception("Memory tool error")
@@ -316,6 +570,10 @@ if __name__ == "__main__":
         content = test_manager.read_file("test.md")
         print(f"Content:\n{content}")
 
+        # Test bulk read
+        print("\n3b. Reading several files...")
+        print(test_manager.read_many(["test.md", "missing.md"]))
+
         # Test append
         print("\n4. Appending to file...")
         result = test_manager.append_to_file("test.md", "\n\nAppended content.")